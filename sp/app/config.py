@@ -947,7 +947,11 @@ def _load_vault_override_bool(key: str) -> Optional[bool]:
         return None
     if not row:
         return None
-    val = str(row[0]).strip().lower()
+    return _parse_override_bool(row[0])
+
+
+def _parse_override_bool(raw) -> Optional[bool]:
+    val = str(raw).strip().lower()
     if val in {"true", "1", "yes"}:
         return True
     if val in {"false", "0", "no"}:
@@ -973,64 +977,115 @@ def _save_vault_override_bool(key: str, value: Optional[bool]) -> None:
         return
 
 
+# Short names used by the vault preferences dialog -> kv keys.
+_VAULT_OVERRIDE_KEYS = {
+    "tasks": "override_feature_tasks_enabled",
+    "calendar": "override_feature_calendar_enabled",
+    "link_navigator": "override_feature_link_navigator_enabled",
+    "tags": "override_feature_tags_enabled",
+    "remote_vaults": "override_feature_remote_vaults_enabled",
+    "ai_chats": "override_enable_ai_chats",
+}
+
+
 def load_vault_feature_tasks_override() -> Optional[bool]:
     """Return Tasks feature override for this vault."""
-    return _load_vault_override_bool("override_feature_tasks_enabled")
+    return _load_vault_override_bool(_VAULT_OVERRIDE_KEYS["tasks"])
 
 
 def save_vault_feature_tasks_override(value: Optional[bool]) -> None:
     """Persist Tasks feature override for this vault."""
-    _save_vault_override_bool("override_feature_tasks_enabled", value)
+    _save_vault_override_bool(_VAULT_OVERRIDE_KEYS["tasks"], value)
 
 
 def load_vault_feature_calendar_override() -> Optional[bool]:
     """Return Calendar feature override for this vault."""
-    return _load_vault_override_bool("override_feature_calendar_enabled")
+    return _load_vault_override_bool(_VAULT_OVERRIDE_KEYS["calendar"])
 
 
 def save_vault_feature_calendar_override(value: Optional[bool]) -> None:
     """Persist Calendar feature override for this vault."""
-    _save_vault_override_bool("override_feature_calendar_enabled", value)
+    _save_vault_override_bool(_VAULT_OVERRIDE_KEYS["calendar"], value)
 
 
 def load_vault_feature_link_navigator_override() -> Optional[bool]:
     """Return Link Navigator feature override for this vault."""
-    return _load_vault_override_bool("override_feature_link_navigator_enabled")
+    return _load_vault_override_bool(_VAULT_OVERRIDE_KEYS["link_navigator"])
 
 
 def save_vault_feature_link_navigator_override(value: Optional[bool]) -> None:
     """Persist Link Navigator feature override for this vault."""
-    _save_vault_override_bool("override_feature_link_navigator_enabled", value)
+    _save_vault_override_bool(_VAULT_OVERRIDE_KEYS["link_navigator"], value)
 
 
 def load_vault_feature_tags_override() -> Optional[bool]:
     """Return Tags feature override for this vault."""
-    return _load_vault_override_bool("override_feature_tags_enabled")
+    return _load_vault_override_bool(_VAULT_OVERRIDE_KEYS["tags"])
 
 
 def save_vault_feature_tags_override(value: Optional[bool]) -> None:
     """Persist Tags feature override for this vault."""
-    _save_vault_override_bool("override_feature_tags_enabled", value)
+    _save_vault_override_bool(_VAULT_OVERRIDE_KEYS["tags"], value)
 
 
 def load_vault_feature_remote_vaults_override() -> Optional[bool]:
     """Return Remote Vaults feature override for this vault."""
-    return _load_vault_override_bool("override_feature_remote_vaults_enabled")
+    return _load_vault_override_bool(_VAULT_OVERRIDE_KEYS["remote_vaults"])
 
 
 def save_vault_feature_remote_vaults_override(value: Optional[bool]) -> None:
     """Persist Remote Vaults feature override for this vault."""
-    _save_vault_override_bool("override_feature_remote_vaults_enabled", value)
+    _save_vault_override_bool(_VAULT_OVERRIDE_KEYS["remote_vaults"], value)
 
 
 def load_vault_enable_ai_chats_override() -> Optional[bool]:
     """Return AI Chats override for this vault."""
-    return _load_vault_override_bool("override_enable_ai_chats")
+    return _load_vault_override_bool(_VAULT_OVERRIDE_KEYS["ai_chats"])
 
 
 def save_vault_enable_ai_chats_override(value: Optional[bool]) -> None:
     """Persist AI Chats override for this vault."""
-    _save_vault_override_bool("override_enable_ai_chats", value)
+    _save_vault_override_bool(_VAULT_OVERRIDE_KEYS["ai_chats"], value)
+
+
+def load_vault_overrides_bulk() -> dict[str, Optional[bool]]:
+    """Return every per-vault override with a single query (None = use global)."""
+    result: dict[str, Optional[bool]] = {name: None for name in _VAULT_OVERRIDE_KEYS}
+    conn = _get_conn()
+    if not conn:
+        return result
+    names_by_key = {key: name for name, key in _VAULT_OVERRIDE_KEYS.items()}
+    placeholders = ", ".join("?" for _ in names_by_key)
+    try:
+        rows = conn.execute(
+            f"SELECT key, value FROM kv WHERE key IN ({placeholders})",
+            tuple(names_by_key),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return result
+    for key, value in rows:
+        result[names_by_key[key]] = _parse_override_bool(value)
+    return result
+
+
+def save_vault_overrides_bulk(values: dict[str, Optional[bool]]) -> None:
+    """Persist several per-vault overrides in one transaction; None clears an override."""
+    conn = _get_conn()
+    if not conn or not values:
+        return
+    try:
+        for name, value in values.items():
+            key = _VAULT_OVERRIDE_KEYS[name]
+            if value is None:
+                conn.execute("DELETE FROM kv WHERE key = ?", (key,))
+            else:
+                conn.execute(
+                    "REPLACE INTO kv(key, value) VALUES(?, ?)",
+                    (key, "true" if value else "false"),
+                )
+        conn.commit()
+    except sqlite3.OperationalError:
+        return
 
 
 def load_global_feature_tasks_enabled(default: bool = True) -> bool:
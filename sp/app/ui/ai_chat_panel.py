@@ -881,12 +881,39 @@ def build_api_request(server_config: dict, messages: List[dict], model: str, str
     return url, headers, verify, timeout, payload
 
 
+def resolve_default_ai_target() -> Tuple[dict, Optional[str]]:
+    """Return the default AI server config (empty if none is set) and the default model name."""
+    server_config: dict = {}
+    try:
+        server_name = stillpoint_config.load_default_ai_server()
+    except Exception:
+        server_name = None
+    if server_name:
+        try:
+            server_config = ServerManager().get_server(server_name) or {}
+        except Exception:
+            server_config = {}
+    try:
+        model = stillpoint_config.load_default_ai_model()
+    except Exception:
+        model = None
+    return server_config, model
+
+
 class ApiWorker(QtCore.QThread):
     chunk = QtCore.Signal(str)
     finished = QtCore.Signal(str)
     failed = QtCore.Signal(str)
 
-    def __init__(self, server_config: dict, messages: List[dict], model: str, stream: bool = True, parent=None):
+    def __init__(
+        self,
+        server_config: Optional[dict],
+        messages: List[dict],
+        model: Optional[str],
+        stream: bool = True,
+        parent=None,
+    ):
+        """Pass ``server_config=None`` to resolve the default server (and model, if unset) in the thread."""
         super().__init__(parent)
         self.server_config = server_config
         self.messages = messages
@@ -900,6 +927,13 @@ class ApiWorker(QtCore.QThread):
 
     def run(self) -> None:
         try:
+            if self.server_config is None:
+                server_config, default_model = resolve_default_ai_target()
+                if not server_config:
+                    self.failed.emit("No AI server configured.")
+                    return
+                self.server_config = server_config
+                self.model = self.model or default_model or server_config.get("default_model") or "gpt-3.5-turbo"
             url, headers, verify, timeout, payload = build_api_request(
                 self.server_config, self.messages, self.model, stream=self.stream
             )
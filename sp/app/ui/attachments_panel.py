@@ -13,7 +13,7 @@ from urllib.parse import urlparse
 import httpx
 
 from PySide6.QtCore import Qt, QUrl, QSize, QMimeData, Signal
-from PySide6.QtGui import QIcon, QPixmap, QDesktopServices, QDrag
+from PySide6.QtGui import QIcon, QImageReader, QPixmap, QDesktopServices, QDrag
 from PySide6.QtWidgets import (
     QApplication,
     QStyle,
@@ -73,6 +73,8 @@ class AttachmentsPanel(QWidget):
         super().__init__(parent)
         self.vault_root: Optional[Path] = None
         self._page_attachment_cache: dict[str, set[str]] = {}
+        # (path, mtime_ns, size) -> thumbnail icon, so refreshes don't re-decode unchanged images.
+        self._thumbnail_cache: dict[tuple[str, int, int], QIcon] = {}
         self._http_client = api_client
         self._remote_mode = False
         self._api_base: Optional[str] = None
@@ -173,6 +175,7 @@ class AttachmentsPanel(QWidget):
         """Track the active vault root so attachments can be normalized."""
         self.vault_root = Path(vault_root) if vault_root else None
         self._page_attachment_cache.clear()
+        self._thumbnail_cache.clear()
         if not self._remote_mode:
             self._remote_vault_root = None
 
@@ -576,20 +579,35 @@ class AttachmentsPanel(QWidget):
         if file_path.suffix.lower() in ['.png', '.jpg', '.jpeg', '.gif', '.bmp']:
             # Create thumbnail for image files
             load_t0 = time.perf_counter()
-            pixmap = QPixmap(str(file_path))
-            if not pixmap.isNull():
-                # Scale based on zoom level
-                if self.zoom_level == 1:  # Small
-                    size = 48
-                elif self.zoom_level == 2:  # Medium
-                    size = 96
-                else:  # Large
-                    size = 144
-                
-                scaled = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Scale based on zoom level
+            if self.zoom_level == 1:  # Small
+                size = 48
+            elif self.zoom_level == 2:  # Medium
+                size = 96
+            else:  # Large
+                size = 144
+            try:
+                key = (str(file_path), file_path.stat().st_mtime_ns, size)
+            except OSError:
+                key = None
+            cached = self._thumbnail_cache.get(key) if key else None
+            if cached is not None:
+                return cached
+            # Let the decoder scale while reading instead of decoding full size and scaling after.
+            reader = QImageReader(str(file_path))
+            source = reader.size()
+            if source.isValid():
+                reader.setScaledSize(source.scaled(size, size, Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                icon = QIcon(QPixmap.fromImage(image))
+                if key:
+                    if len(self._thumbnail_cache) >= 512:
+                        self._thumbnail_cache.clear()
+                    self._thumbnail_cache[key] = icon
                 if PAGE_LOGGING_ENABLED:
                     print(f"[PageLoadAndRender] attachments thumbnail {file_path.name} load+scale={(time.perf_counter()-load_t0)*1000:.1f}ms")
-                return QIcon(scaled)
+                return icon
         
         # Use OS file icon for non-images or if thumbnail failed
         from PySide6.QtCore import QFileInfo
@@ -0,0 +1,63 @@
+"""Cached drop shadows for the frameless popup cards.
+
+QGraphicsDropShadowEffect re-blurs the whole card offscreen on every repaint. Instead the
+shadow is blurred once into a small tile and drawn as a nine-slice around the card.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+from PySide6.QtCore import QPoint, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QGraphicsBlurEffect, QGraphicsScene
+
+
+@lru_cache(maxsize=None)
+def shadow_tile(blur: int, corner: int, alpha: int) -> QPixmap:
+    """Return a blurred rounded-rect tile whose edges can be stretched to any card size."""
+    inner = 2 * corner + 4
+    size = inner + 2 * blur
+    source = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    source.fill(Qt.transparent)
+    painter = QPainter(source)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(0, 0, 0, alpha))
+    painter.drawRoundedRect(QRectF(blur, blur, inner, inner), corner, corner)
+    painter.end()
+    scene = QGraphicsScene()
+    item = scene.addPixmap(QPixmap.fromImage(source))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    item.setGraphicsEffect(effect)
+    blurred = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    blurred.fill(Qt.transparent)
+    painter = QPainter(blurred)
+    scene.render(painter, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+    painter.end()
+    return QPixmap.fromImage(blurred)
+
+
+def paint_card_shadow(
+    painter: QPainter,
+    card_rect: QRect,
+    *,
+    blur: int = 24,
+    corner: int = 10,
+    alpha: int = 90,
+    offset: QPoint = QPoint(0, 6),
+) -> None:
+    """Draw the cached shadow tile nine-sliced around card_rect (in the painter's coordinates)."""
+    tile = shadow_tile(blur, corner, alpha)
+    edge = blur + corner
+    size = tile.width()
+    target = card_rect.translated(offset).adjusted(-blur, -blur, blur, blur)
+    src = (0, edge, size - edge, size)
+    dst_x = (target.left(), target.left() + edge, target.right() + 1 - edge, target.right() + 1)
+    dst_y = (target.top(), target.top() + edge, target.bottom() + 1 - edge, target.bottom() + 1)
+    for col in range(3):
+        for row in range(3):
+            dst = QRect(dst_x[col], dst_y[row], dst_x[col + 1] - dst_x[col], dst_y[row + 1] - dst_y[row])
+            if dst.width() <= 0 or dst.height() <= 0:
+                continue
+            painter.drawPixmap(dst, tile, QRect(src[col], src[row], src[col + 1] - src[col], src[row + 1] - src[row]))
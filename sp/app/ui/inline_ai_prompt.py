@@ -4,12 +4,11 @@ from typing import Callable, Optional
 
 import platform
 
-from PySide6.QtCore import Qt, Signal, QTimer, QPoint
-from PySide6.QtGui import QKeyEvent, QFont, QFontDatabase, QColor
+from PySide6.QtCore import Qt, Signal, QEvent, QTimer, QPoint
+from PySide6.QtGui import QKeyEvent, QFont, QFontDatabase, QPainter
 from PySide6.QtWidgets import (
     QDialog,
     QFrame,
-    QGraphicsDropShadowEffect,
     QLabel,
     QTextEdit,
     QVBoxLayout,
@@ -18,6 +17,8 @@ from PySide6.QtWidgets import (
 
 from sp.app import config
 
+from .card_shadow import paint_card_shadow
+
 
 class InlineAIPromptInput(QTextEdit):
     sendRequested = Signal()
@@ -58,9 +59,6 @@ class InlineAIPromptOverlay(QDialog):
         self.setModal(False)
         self._on_send = on_send
         self._anchor = anchor
-        self._focus_timer = QTimer(self)
-        self._focus_timer.setInterval(150)
-        self._focus_timer.timeout.connect(self._ensure_input_focus)
         self._build_ui()
 
     def _default_chat_font_family(self) -> str:
@@ -97,14 +95,8 @@ class InlineAIPromptOverlay(QDialog):
             "  border-radius: 12px;"
             "}"
         )
-        try:
-            shadow = QGraphicsDropShadowEffect(card)
-            shadow.setBlurRadius(24)
-            shadow.setOffset(0, 6)
-            shadow.setColor(QColor(0, 0, 0, 120))
-            card.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+        # The drop shadow is painted by the dialog from a cached tile (see paintEvent).
+        self._card = card
         outer.addWidget(card, 1)
 
         layout = QVBoxLayout(card)
@@ -127,6 +119,8 @@ class InlineAIPromptOverlay(QDialog):
         )
         self.input.sendRequested.connect(self._send)
         self.input.dismissRequested.connect(self.reject)
+        # Re-check focus only when the input actually loses it, instead of polling.
+        self.input.installEventFilter(self)
         layout.addWidget(self.input)
 
         hint = QLabel("Enter to send, Esc to cancel (Shift+Enter for newline)", card)
@@ -153,11 +147,19 @@ class InlineAIPromptOverlay(QDialog):
             except Exception:
                 pass
         self._ensure_input_focus()
-        self._focus_timer.start()
-
-    def hideEvent(self, event) -> None:  # type: ignore[override]
-        self._focus_timer.stop()
-        super().hideEvent(event)
+        # Retry once the window manager has finished mapping/activating the popup.
+        QTimer.singleShot(0, self._ensure_input_focus)
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        super().paintEvent(event)
+        painter = QPainter(self)
+        paint_card_shadow(painter, self._card.geometry(), corner=12, alpha=120)
+        painter.end()
+
+    def eventFilter(self, obj, event) -> bool:  # type: ignore[override]
+        if obj is self.input and event.type() == QEvent.FocusOut:
+            QTimer.singleShot(0, self._ensure_input_focus)
+        return super().eventFilter(obj, event)
 
     def _ensure_input_focus(self) -> None:
         if not self.isVisible():
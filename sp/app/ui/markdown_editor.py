@@ -1295,6 +1295,9 @@ class MarkdownEditor(QTextEdit):
         self._vi_paint_in_progress: bool = False
         self._vi_activation_timer: Optional[QTimer] = None
         self._heading_outline: list[dict] = []
+        # Earliest document position edited since the last outline scan (0 = rescan everything).
+        self._outline_dirty_pos: Optional[int] = 0
+        self._outline_document: Optional[QTextDocument] = None
         self._dialog_block_input: bool = False
         self._read_only_mode: bool = False
         self._ai_actions_enabled: bool = True
@@ -1306,6 +1309,7 @@ class MarkdownEditor(QTextEdit):
         self._move_text_callback: Optional[Callable[[str, str], bool]] = None
         self._suppress_link_scan: bool = False
         self._suppress_vi_cursor: bool = False
+        self._selection_updates_suspended: bool = False
         self._overlay_transition: bool = False  # True while a mode overlay is spinning up/down
         self._overlay_active: bool = False  # True while inside a ModeWindow
         self._cursor_events_blocked: bool = False
@@ -1486,6 +1490,8 @@ class MarkdownEditor(QTextEdit):
             self._document_alive = False
             return
         document.destroyed.connect(self._on_document_destroyed)
+        document.contentsChange.connect(self._note_outline_change)
+        self._outline_dirty_pos = 0
         self._document_alive = True
         layout = document.documentLayout()
         if layout is not None:
@@ -2013,6 +2019,8 @@ class MarkdownEditor(QTextEdit):
                 pass
             self.document().clear()
             self.clear()
+            # The document's signals were blocked above, so contentsChange never saw this.
+            self._outline_dirty_pos = 0
         finally:
             self.setUpdatesEnabled(True)
             try:
@@ -4954,6 +4962,17 @@ class MarkdownEditor(QTextEdit):
         else:
             self.linkHovered.emit("")  # Empty string to clear status bar
 
+    def set_selection_updates_enabled(self, enabled: bool) -> None:
+        """Pause/resume vi-cursor and rule extra-selection updates (e.g. while streaming text in)."""
+        if self._selection_updates_suspended == (not enabled):
+            return
+        self._selection_updates_suspended = not enabled
+        if enabled:
+            self._vi_last_cursor_pos = -1
+            self._update_vi_cursor()
+            if self._hr_live_refresh_enabled:
+                self._refresh_hr_selections()
+
     # --- Vi-mode cursor -------------------------------------------------
     def set_vi_block_cursor_enabled(self, enabled: bool) -> None:
         """Set whether vi-mode should show a block cursor. Does not affect vi-mode navigation."""
@@ -5855,6 +5874,7 @@ class MarkdownEditor(QTextEdit):
             self._cursor_events_blocked
             or self._display_guard
             or self._suppress_vi_cursor
+            or self._selection_updates_suspended
             or type(self)._LOAD_GUARD_DEPTH > 0
             or self._in_mode_window_transition()
         ):
@@ -5998,6 +6018,8 @@ class MarkdownEditor(QTextEdit):
     def _schedule_hr_selections(self) -> None:
         if not self._hr_live_refresh_enabled:
             return
+        if self._selection_updates_suspended:
+            return
         if self._mutations_blocked():
             return
         if self._hr_timer.isActive():
@@ -6037,9 +6059,28 @@ class MarkdownEditor(QTextEdit):
         self._hr_refresh_retry_pending = False
         self._refresh_hr_selections()
 
+    def _note_outline_change(self, position: int, _removed: int, _added: int) -> None:
+        if self._outline_dirty_pos is None or position < self._outline_dirty_pos:
+            self._outline_dirty_pos = position
+
     def _emit_heading_outline(self) -> None:
+        doc = self.document()
+        dirty_pos = self._outline_dirty_pos
+        self._outline_dirty_pos = None
         outline: list[dict] = []
-        block = self.document().firstBlock()
+        block = doc.firstBlock()
+        if dirty_pos and self._outline_document is doc:
+            start = doc.findBlock(dirty_pos)
+            if start.isValid():
+                # Blocks before the first edited one keep their text, line numbers and positions,
+                # so their entries carry over and only the tail is rescanned.
+                first_line = start.blockNumber()
+                for entry in self._heading_outline:
+                    if entry["line"] > first_line:
+                        break
+                    outline.append(entry)
+                block = start
+        self._outline_document = doc
         while block.isValid():
             text = block.text()
             stripped = text.lstrip()
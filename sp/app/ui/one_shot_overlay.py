@@ -5,12 +5,11 @@ import re
 from pathlib import Path
 from typing import Callable, Optional
 
-from PySide6.QtCore import QTimer, Qt, Signal
-from PySide6.QtGui import QDesktopServices, QIcon, QKeyEvent, QPalette, QTextCursor, QFont, QFontDatabase, QColor
+from PySide6.QtCore import QPoint, QTimer, Qt, Signal
+from PySide6.QtGui import QDesktopServices, QIcon, QKeyEvent, QPalette, QTextCursor, QFont, QFontDatabase, QPainter
 from PySide6.QtWidgets import (
     QDialog,
     QFrame,
-    QGraphicsDropShadowEffect,
     QHBoxLayout,
     QLabel,
     QTextBrowser,
@@ -24,6 +23,8 @@ import platform
 
 from sp.app import config
 
+from .card_shadow import paint_card_shadow
+
 
 class OneShotChatInput(QTextEdit):
     sendRequested = Signal()
@@ -164,14 +165,8 @@ class OneShotPromptOverlay(QDialog):
         card = QFrame(self)
         card.setObjectName("OneShotCard")
         card.setFrameShape(QFrame.NoFrame)
-        try:
-            shadow = QGraphicsDropShadowEffect(card)
-            shadow.setBlurRadius(24)
-            shadow.setOffset(0, 8)
-            shadow.setColor(QColor(0, 0, 0, 140))
-            card.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+        # The drop shadow is painted by the dialog from a cached tile (see paintEvent).
+        self._card = card
         outer.addWidget(card, 1)
 
         layout = QVBoxLayout(card)
@@ -259,6 +254,12 @@ class OneShotPromptOverlay(QDialog):
         super().showEvent(event)
         self._focus_input_deferred()
 
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        super().paintEvent(event)
+        painter = QPainter(self)
+        paint_card_shadow(painter, self._card.geometry(), corner=14, alpha=140, offset=QPoint(0, 8))
+        painter.end()
+
     def _focus_input_deferred(self) -> None:
         def _do() -> None:
             try:
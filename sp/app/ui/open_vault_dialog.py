@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 import os
 import time
 from typing import Optional
 from urllib.parse import urlparse
 
-from PySide6.QtCore import Qt, QUrl
-from PySide6.QtGui import QDesktopServices, QPixmap
+from PySide6.QtCore import QRect, QSize, Qt, QUrl
+from PySide6.QtGui import QColor, QDesktopServices, QFont, QFontMetrics, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -18,10 +20,14 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
     QPushButton,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTabWidget,
     QVBoxLayout,
     QWidget,
@@ -89,6 +95,160 @@ class AddVaultDialog(QDialog):
         return self._result
 
 
+class _Status(IntEnum):
+    UNKNOWN = 0
+    OK = 1
+    ERROR = 2
+
+
+_STATUS_CODES = {"ok": _Status.OK, "error": _Status.ERROR}
+# Parsed remote status per (server_url, path); kept beside the vault dicts so they reach callers unchanged.
+_STATUS_CACHE: dict[tuple[str, str], _Status] = {}
+
+
+def _status_key(vault: dict) -> tuple[str, str]:
+    return (vault.get("server_url") or "", vault.get("path") or "")
+
+
+def _status_code(vault: dict) -> _Status:
+    """Return the remote status as an int code, parsing it once per vault."""
+    key = _status_key(vault)
+    code = _STATUS_CACHE.get(key)
+    if code is None:
+        code = _STATUS_CODES.get(vault.get("status", "unknown"), _Status.UNKNOWN)
+        _STATUS_CACHE[key] = code
+    return code
+
+
+def _reset_status_codes(vaults: list[dict]) -> None:
+    """Re-parse the status of freshly loaded remote vaults instead of reusing a cached one."""
+    for vault in vaults:
+        _STATUS_CACHE.pop(_status_key(vault), None)
+        _status_code(vault)
+
+
+@lru_cache(maxsize=8)
+def _status_dot_size(family: str) -> int:
+    """Diameter of the "●" glyph at 16pt, the size the old per-row status label used."""
+    font = QFont(family)
+    font.setPointSize(16)
+    metrics = QFontMetrics(font)
+    size = metrics.tightBoundingRect("●").width()
+    return size if size > 0 else metrics.ascent() // 2
+
+
+class VaultItemDelegate(QStyledItemDelegate):
+    """Paint vault rows (bold name, small path, status dot) without per-row widgets."""
+
+    _MARGIN_X = 8
+    _MARGIN_Y = 6
+    _SPACING = 2
+    _ERROR_COLOR = QColor("#d32f2f")
+    _OK_COLOR = QColor("#4caf50")
+    _PATH_COLOR = QColor("#666666")
+
+    @staticmethod
+    def _fonts(option: QStyleOptionViewItem) -> tuple[QFont, QFont]:
+        name_font = QFont(option.font)
+        name_font.setBold(True)
+        small_font = QFont(option.font)
+        small_font.setPointSize(max(small_font.pointSize() - 2, 8))
+        return name_font, small_font
+
+    @staticmethod
+    def _error_text(vault: dict) -> str:
+        if vault.get("kind") == "remote" and vault.get("error"):
+            return f"Error: {vault.get('error')}"
+        return ""
+
+    def _text_width(self, option: QStyleOptionViewItem) -> int:
+        # option.rect can still hold the row's pre-resize geometry, so go by the live viewport.
+        if option.widget is not None:
+            width = option.widget.viewport().width()
+        else:
+            width = option.rect.width()
+        return max(width - 2 * self._MARGIN_X, 50)
+
+    def _layout(self, option: QStyleOptionViewItem, vault: dict) -> tuple[QFont, QFont, int, int, int]:
+        name_font, small_font = self._fonts(option)
+        width = self._text_width(option)
+        small_metrics = QFontMetrics(small_font)
+        path = OpenVaultDialog._format_vault_path(vault)
+        name_h = QFontMetrics(name_font).height()
+        if vault.get("kind") == "remote" and _status_code(vault) != _Status.UNKNOWN:
+            name_h = max(name_h, _status_dot_size(option.font.family()))
+        path_h = small_metrics.boundingRect(QRect(0, 0, width, 10000), Qt.TextWordWrap, path).height()
+        error = self._error_text(vault)
+        error_h = (
+            small_metrics.boundingRect(QRect(0, 0, width, 10000), Qt.TextWordWrap, error).height()
+            if error
+            else 0
+        )
+        return name_font, small_font, name_h, path_h, error_h
+
+    def paint(self, painter, option: QStyleOptionViewItem, index) -> None:
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget is not None else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        vault = index.data(Qt.UserRole) or {}
+        name_font, small_font, name_h, path_h, error_h = self._layout(option, vault)
+        selected = bool(opt.state & QStyle.State_Selected)
+        text_color = opt.palette.highlightedText().color() if selected else opt.palette.text().color()
+        code = _status_code(vault) if vault.get("kind") == "remote" else _Status.UNKNOWN
+        is_error = code == _Status.ERROR
+
+        painter.save()
+        rect = option.rect.adjusted(self._MARGIN_X, self._MARGIN_Y, -self._MARGIN_X, -self._MARGIN_Y)
+        y = rect.top()
+
+        name_rect = QRect(rect.left(), y, rect.width(), name_h)
+        if code != _Status.UNKNOWN:
+            dot = _status_dot_size(option.font.family())
+            dot_rect = QRect(rect.right() - dot, y + (name_h - dot) // 2, dot, dot)
+            painter.setRenderHint(painter.RenderHint.Antialiasing, True)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._ERROR_COLOR if is_error else self._OK_COLOR)
+            painter.drawEllipse(dot_rect)
+            name_rect.setRight(dot_rect.left() - 8)
+        painter.setFont(name_font)
+        painter.setPen(self._ERROR_COLOR if is_error else text_color)
+        name = vault.get("name") or Path(vault.get("path") or "").name
+        elided = QFontMetrics(name_font).elidedText(name, Qt.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, elided)
+        y += name_h + self._SPACING
+
+        painter.setFont(small_font)
+        if is_error:
+            painter.setPen(self._ERROR_COLOR)
+        else:
+            painter.setPen(text_color if selected else self._PATH_COLOR)
+        painter.drawText(
+            QRect(rect.left(), y, rect.width(), path_h),
+            Qt.AlignLeft | Qt.TextWordWrap,
+            OpenVaultDialog._format_vault_path(vault),
+        )
+        if error_h:
+            y += path_h + self._SPACING
+            painter.setPen(self._ERROR_COLOR)
+            painter.drawText(
+                QRect(rect.left(), y, rect.width(), error_h),
+                Qt.AlignLeft | Qt.TextWordWrap,
+                self._error_text(vault),
+            )
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
+        vault = index.data(Qt.UserRole) or {}
+        _name_font, _small_font, name_h, path_h, error_h = self._layout(option, vault)
+        height = 2 * self._MARGIN_Y + name_h + self._SPACING + path_h
+        if error_h:
+            height += self._SPACING + error_h
+        return QSize(self._text_width(option) + 2 * self._MARGIN_X, height)
+
+
 class OpenVaultDialog(QDialog):
     """Dialog for selecting, adding, and managing vaults."""
 
@@ -118,6 +278,9 @@ class OpenVaultDialog(QDialog):
         self._select_id = select_id
         self._remote_loaded = False
         self._remote_vaults_enabled = config.load_feature_remote_vaults_enabled()
+        self._remote_servers_cache: Optional[list[dict[str, str]]] = None
+        self._last_combo_key: Optional[tuple[tuple[str, str], ...]] = None
+        self._ok_button: Optional[QPushButton] = None
 
         layout = QVBoxLayout(self)
         intro_row = QHBoxLayout()
@@ -142,7 +305,11 @@ class OpenVaultDialog(QDialog):
         local_layout = QVBoxLayout(local_tab)
         local_layout.setContentsMargins(0, 0, 0, 0)
         local_layout.setSpacing(6)
+        self._item_delegate = VaultItemDelegate(self)
         self.local_list_widget = QListWidget()
+        self.local_list_widget.setItemDelegate(self._item_delegate)
+        # Row heights depend on the wrap width, so relayout when the list is resized.
+        self.local_list_widget.setResizeMode(QListView.ResizeMode.Adjust)
         self.local_list_widget.itemDoubleClicked.connect(self._accept_current)
         self.local_list_widget.currentItemChanged.connect(self._on_selection_changed)
         local_layout.addWidget(self.local_list_widget, 1)
@@ -171,6 +338,8 @@ class OpenVaultDialog(QDialog):
             remote_layout.setContentsMargins(0, 0, 0, 0)
             remote_layout.setSpacing(6)
             self.remote_list_widget = QListWidget()
+            self.remote_list_widget.setItemDelegate(self._item_delegate)
+            self.remote_list_widget.setResizeMode(QListView.ResizeMode.Adjust)
             self.remote_list_widget.itemDoubleClicked.connect(self._accept_current)
             self.remote_list_widget.currentItemChanged.connect(self._on_selection_changed)
             remote_layout.addWidget(self.remote_list_widget, 1)
@@ -201,6 +370,7 @@ class OpenVaultDialog(QDialog):
         self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         self.button_box.accepted.connect(self._accept_current)
         self.button_box.rejected.connect(self.reject)
+        self._ok_button = self.button_box.button(QDialogButtonBox.Ok)
         open_new_btn = self.button_box.addButton("Open in New Window", QDialogButtonBox.ActionRole)
         open_new_btn.clicked.connect(self._accept_new_window)
         layout.addWidget(self.button_box)
@@ -225,25 +395,25 @@ class OpenVaultDialog(QDialog):
         select_path: Optional[str] = None,
         select_id: Optional[str] = None,
     ) -> None:
-        list_widget.clear()
-        for vault in vaults:
-            if "id" not in vault:
-                vault["id"] = vault.get("path")
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, vault)
-            widget = self._build_item_widget(vault)
-            item.setSizeHint(widget.sizeHint())
-            list_widget.addItem(item)
-            list_widget.setItemWidget(item, widget)
-
-        if vaults:
-            target_id = select_id or select_path or vaults[0].get("path")
-            for idx in range(list_widget.count()):
-                item = list_widget.item(idx)
-                data = item.data(Qt.UserRole)
-                if data and data.get("id") == target_id:
-                    list_widget.setCurrentItem(item)
-                    break
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            for vault in vaults:
+                if "id" not in vault:
+                    vault["id"] = vault.get("path")
+                list_widget.addItem(self._build_item(vault))
+
+            if vaults:
+                target_id = select_id or select_path or vaults[0].get("path")
+                for idx in range(list_widget.count()):
+                    item = list_widget.item(idx)
+                    data = item.data(Qt.UserRole)
+                    if data and data.get("id") == target_id:
+                        list_widget.setCurrentItem(item)
+                        break
+        finally:
+            list_widget.blockSignals(False)
+        self._update_buttons()
 
     def _refresh_local_list(self, select_path: Optional[str] = None) -> None:
         self._populate_list(
@@ -253,20 +423,21 @@ class OpenVaultDialog(QDialog):
             select_id=self._select_id,
         )
         self._refresh_default_combo()
-        self._update_buttons()
 
     def _refresh_remote_list(self, select_id: Optional[str] = None) -> None:
         if not self.remote_list_widget:
             return
         self._populate_remote_list(select_id=select_id)
-        self._update_buttons()
 
     def _refresh_default_combo(self) -> None:
         self.default_combo.blockSignals(True)
-        self.default_combo.clear()
-        self.default_combo.addItem("No default", None)
-        for vault in self.local_vaults:
-            self.default_combo.addItem(vault["name"], vault["path"])
+        key = tuple((v["name"], v["path"]) for v in self.local_vaults)
+        if key != self._last_combo_key:
+            self.default_combo.clear()
+            self.default_combo.addItem("No default", None)
+            for name, path in key:
+                self.default_combo.addItem(name, path)
+            self._last_combo_key = key
         idx = self.default_combo.findData(self.default_vault)
         if idx != -1:
             self.default_combo.setCurrentIndex(idx)
@@ -277,63 +448,17 @@ class OpenVaultDialog(QDialog):
             self.default_combo.setCurrentIndex(0)
         self.default_combo.blockSignals(False)
 
-    def _build_item_widget(self, vault: dict[str, str]) -> QWidget:
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(8, 6, 8, 6)
-        layout.setSpacing(2)
-
-        # Create a horizontal layout for name and status indicator
-        name_row = QHBoxLayout()
-        name_row.setSpacing(8)
-        
-        name_label = QLabel(vault.get("name") or Path(vault["path"]).name)
-        name_font = name_label.font()
-        name_font.setBold(True)
-        name_label.setFont(name_font)
-        name_row.addWidget(name_label, 1)
-        
-        # Add status indicator for remote vaults
+    @staticmethod
+    def _build_item(vault: dict[str, str]) -> QListWidgetItem:
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, vault)
         if vault.get("kind") == "remote":
-            status = vault.get("status", "unknown")
-            if status == "error":
-                status_label = QLabel("●")
-                status_label.setStyleSheet("color: #d32f2f; font-size: 16pt;")
-                status_label.setToolTip(vault.get("error", "Connection failed"))
-                name_row.addWidget(status_label)
-                # Make the name label red too
-                name_label.setStyleSheet("color: #d32f2f;")
-            elif status == "ok":
-                status_label = QLabel("●")
-                status_label.setStyleSheet("color: #4caf50; font-size: 16pt;")
-                status_label.setToolTip("Connected")
-                name_row.addWidget(status_label)
-        
-        layout.addLayout(name_row)
-
-        path_label = QLabel(self._format_vault_path(vault))
-        path_label.setWordWrap(True)
-        path_font = path_label.font()
-        path_font.setPointSize(max(path_font.pointSize() - 2, 8))
-        path_label.setFont(path_font)
-        # Gray color unless there's an error
-        if vault.get("kind") == "remote" and vault.get("status") == "error":
-            path_label.setStyleSheet("color: #d32f2f;")
-        else:
-            path_label.setStyleSheet("color: #666;")
-        layout.addWidget(path_label)
-        
-        # Add error message if present
-        if vault.get("kind") == "remote" and vault.get("error"):
-            error_label = QLabel(f"Error: {vault.get('error')}")
-            error_label.setWordWrap(True)
-            error_font = error_label.font()
-            error_font.setPointSize(max(error_font.pointSize() - 2, 8))
-            error_label.setFont(error_font)
-            error_label.setStyleSheet("color: #d32f2f;")
-            layout.addWidget(error_label)
-
-        return container
+            code = _status_code(vault)
+            if code == _Status.ERROR:
+                item.setToolTip(vault.get("error", "Connection failed"))
+            elif code == _Status.OK:
+                item.setToolTip("Connected")
+        return item
 
     @staticmethod
     def _format_vault_path(vault: dict[str, str]) -> str:
@@ -363,6 +488,9 @@ class OpenVaultDialog(QDialog):
 
     def _on_tab_changed(self, index: int) -> None:
         if self._remote_vaults_enabled and index == 1:
+            # Remote server config is only read once the Remote tab is actually shown.
+            if not self._remote_loaded and self._on_load_remote:
+                self._set_remote_loading_entries()
             self._load_remote_vaults(select_id=self._select_id)
         self._update_buttons()
 
@@ -383,7 +511,6 @@ class OpenVaultDialog(QDialog):
             if debug:
                 print(f"[RemoteVaults] load skipped (no loader) dt={(time.perf_counter()-start)*1000:.1f}ms")
             return
-        self._set_remote_loading_entries()
         QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
             updated = self._on_load_remote() if callable(self._on_load_remote) else None
@@ -397,6 +524,7 @@ class OpenVaultDialog(QDialog):
                 self.remote_vaults = [v for v in updated if v.get("kind") == "remote"]
             else:
                 self.remote_vaults = list(updated)
+            _reset_status_codes(self.remote_vaults)
         self.remote_status_entries = list(status_entries)
         self._remote_loaded = True
         self._refresh_remote_list(select_id=select_id)
@@ -409,6 +537,7 @@ class OpenVaultDialog(QDialog):
     def _split_vaults(self, vaults: list[dict[str, str]]) -> None:
         self.local_vaults = [v for v in vaults if v.get("kind") != "remote"]
         self.remote_vaults = [v for v in vaults if v.get("kind") == "remote"]
+        _reset_status_codes(self.remote_vaults)
 
     def _active_list_widget(self) -> QListWidget:
         if self._remote_vaults_enabled and self.remote_list_widget and self.tabs.currentIndex() == 1:
@@ -416,7 +545,7 @@ class OpenVaultDialog(QDialog):
         return self.local_list_widget
 
     def _update_buttons(self) -> None:
-        if not hasattr(self, "button_box"):
+        if self._ok_button is None:
             return
         current_list = self._active_list_widget()
         current_item = current_list.currentItem()
@@ -432,9 +561,7 @@ class OpenVaultDialog(QDialog):
             self.remove_remote_btn.setEnabled(
                 current_list is self.remote_list_widget and is_remote_vault
             )
-        ok_button = self.button_box.button(QDialogButtonBox.Ok)
-        if ok_button:
-            ok_button.setEnabled(has_selection)
+        self._ok_button.setEnabled(has_selection)
 
     def _accept_current(self) -> None:
         item = self._active_list_widget().currentItem()
@@ -477,6 +604,7 @@ class OpenVaultDialog(QDialog):
         if not self._on_add_remote:
             return
         updated = self._on_add_remote()
+        self._remote_servers_cache = None
         if not updated:
             return
         self._split_vaults(updated)
@@ -530,7 +658,7 @@ class OpenVaultDialog(QDialog):
         if not host:
             return
         
-        servers = config.load_remote_servers()
+        servers = self._get_remote_servers()
         changed = False
         for entry in servers:
             if (
@@ -544,6 +672,7 @@ class OpenVaultDialog(QDialog):
                     changed = True
         if changed:
             config.save_remote_servers(servers)
+            self._remote_servers_cache = servers
         self.remote_vaults = [v for v in self.remote_vaults if v.get("id") != vault.get("id")]
         self._refresh_remote_list()
 
@@ -560,30 +689,36 @@ class OpenVaultDialog(QDialog):
         if not host or not port:
             return
         config.delete_remote_server(host, int(port), scheme=scheme)
+        self._remote_servers_cache = None
+
+    def _get_remote_servers(self) -> list[dict[str, str]]:
+        if self._remote_servers_cache is None:
+            self._remote_servers_cache = config.load_remote_servers()
+        return self._remote_servers_cache
 
     def _populate_remote_list(self, select_id: Optional[str] = None) -> None:
         if not self.remote_list_widget:
             return
-        self.remote_list_widget.clear()
-        
-        # Only show configured vaults with embedded status
-        for vault in self.remote_vaults:
-            if "id" not in vault:
-                vault["id"] = vault.get("path")
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, vault)
-            widget = self._build_item_widget(vault)
-            item.setSizeHint(widget.sizeHint())
-            self.remote_list_widget.addItem(item)
-            self.remote_list_widget.setItemWidget(item, widget)
-
-        if select_id:
-            for idx in range(self.remote_list_widget.count()):
-                item = self.remote_list_widget.item(idx)
-                data = item.data(Qt.UserRole)
-                if data and data.get("id") == select_id:
-                    self.remote_list_widget.setCurrentItem(item)
-                    break
+        self.remote_list_widget.blockSignals(True)
+        try:
+            self.remote_list_widget.clear()
+
+            # Only show configured vaults with embedded status
+            for vault in self.remote_vaults:
+                if "id" not in vault:
+                    vault["id"] = vault.get("path")
+                self.remote_list_widget.addItem(self._build_item(vault))
+
+            if select_id:
+                for idx in range(self.remote_list_widget.count()):
+                    item = self.remote_list_widget.item(idx)
+                    data = item.data(Qt.UserRole)
+                    if data and data.get("id") == select_id:
+                        self.remote_list_widget.setCurrentItem(item)
+                        break
+        finally:
+            self.remote_list_widget.blockSignals(False)
+        self._update_buttons()
 
     def _build_status_item_widget(self, entry: dict[str, str]) -> QWidget:
         container = QWidget()
@@ -620,7 +755,7 @@ class OpenVaultDialog(QDialog):
         if not self.remote_list_widget:
             return
         entries: list[dict[str, str]] = []
-        for server in config.load_remote_servers():
+        for server in self._get_remote_servers():
             host = server.get("host")
             port = server.get("port")
             scheme = server.get("scheme") or "http"
@@ -639,10 +774,8 @@ class OpenVaultDialog(QDialog):
             )
         self.remote_status_entries = entries
         self._refresh_remote_list()
-        try:
-            QApplication.processEvents()
-        except Exception:
-            pass
+        # The loader still runs synchronously, so paint just this list before it blocks.
+        self.remote_list_widget.repaint()
 
     def _open_config_file(self) -> None:
         try:
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
+import hashlib
+import json
+import logging
+import threading
+import time
 import traceback
 import httpx
 
-from PySide6.QtCore import QTimer, Qt, QByteArray, QObject, QEvent, QPoint
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QRect,
+    QThread,
+    QTimer,
+    Qt,
+)
 from PySide6.QtGui import QAction, QKeySequence, QShortcut, QColor, QIcon, QTextCursor, QTextFormat
 from PySide6.QtWidgets import (
     QApplication,
@@ -15,8 +32,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QToolBar,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -28,32 +44,218 @@ from .page_load_logger import PageLoadLogger, PAGE_LOGGING_ENABLED
 from sp.app import config
 from sp.server.adapters.files import PAGE_SUFFIXES
 
+logger = logging.getLogger(__name__)
 
-_ONE_SHOT_PROMPT_CACHE: Optional[str] = None
-
+# Picker indent per heading level (H1..H5), indexed by level - 1.
+_LEVEL_INDENTS = tuple("    " * i for i in range(5))
 
+@lru_cache(maxsize=1)
 def _load_one_shot_prompt() -> str:
     """Load the one-shot system prompt once and cache it."""
-    global _ONE_SHOT_PROMPT_CACHE
-    if _ONE_SHOT_PROMPT_CACHE is not None:
-        return _ONE_SHOT_PROMPT_CACHE
     default_prompt = "you are a helpful assistent, you will respond with markdown formatting"
     try:
         prompt_path = Path(__file__).parent.parent / "one-shot-prompt.txt"
         if prompt_path.exists():
             content = prompt_path.read_text(encoding="utf-8").strip()
             if content:
-                _ONE_SHOT_PROMPT_CACHE = content
                 return content
     except Exception:
         pass
-    _ONE_SHOT_PROMPT_CACHE = default_prompt
     return default_prompt
 
 
+def _trigrams(text: str) -> frozenset[str]:
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+def _content_digest(data: bytes) -> bytes:
+    """Short fingerprint used to compare editor content with the last saved version."""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+@lru_cache(maxsize=1)
+def _ai_assist_imports():
+    """Import the AI assist dependencies on first use and reuse them afterwards."""
+    from .ai_chat_panel import ServerManager
+    from .one_shot_overlay import OneShotPromptOverlay
+
+    return ServerManager, OneShotPromptOverlay
+
+
+_PROMPT_PREFETCH_STARTED = False
+
+
+def _prefetch_one_shot_prompt() -> None:
+    """Warm the prompt cache off the UI thread so the first AI action doesn't wait on disk."""
+    global _PROMPT_PREFETCH_STARTED
+    if _PROMPT_PREFETCH_STARTED:
+        return
+    _PROMPT_PREFETCH_STARTED = True
+    threading.Thread(target=_load_one_shot_prompt, name="one-shot-prompt-prefetch", daemon=True).start()
+
+
+class _HeadingListModel(QAbstractListModel):
+    """Heading rows for the picker views; only visible rows are ever materialized by the view."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._headings: list[dict] = []
+        self._rows: list[dict] = []
+        self._needle = ""
+
+    def set_headings(self, headings: list[dict]) -> None:
+        if headings is self._headings and self._rows is headings:
+            return
+        self.beginResetModel()
+        self._headings = headings
+        self._rows = headings
+        self._needle = ""
+        self.endResetModel()
+
+    def set_filter(self, query: str) -> bool:
+        """Show only headings whose title contains ``query`` (case-insensitive); True if the rows changed."""
+        needle = query.casefold().strip()
+        if needle == self._needle:
+            return False
+        # Typing more only narrows the match, so scan the rows already shown instead of the full TOC.
+        narrowing = bool(self._needle) and needle.startswith(self._needle)
+        if not needle:
+            rows = self._headings
+        else:
+            source = self._rows if narrowing else self._headings
+            # Trigram sets reject most non-matches with hash lookups before the substring scan.
+            needle_tris = _trigrams(needle) if len(needle) >= 3 else None
+            rows = [
+                h
+                for h in source
+                if (needle_tris is None or needle_tris <= h["_trigrams"]) and needle in h["_title_cf"]
+            ]
+        self._needle = needle
+        if narrowing and len(rows) == len(self._rows):
+            # Nothing dropped out, so the view (and its current row) can stay as-is.
+            return False
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        return True
+
+    def heading(self, row: int) -> Optional[dict]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()]["_display"]
+        if role == Qt.UserRole:
+            return self._rows[index.row()]
+        return None
+
+
+def _make_heading_view(parent: QWidget, model: _HeadingListModel) -> QListView:
+    view = QListView(parent)
+    view.setModel(model)
+    view.setUniformItemSizes(True)
+    view.setLayoutMode(QListView.Batched)
+    view.setBatchSize(50)
+    view.setEditTriggers(QListView.NoEditTriggers)
+    return view
+
+
+class _HeadingPickerFilter(QObject):
+    """Key handling (Enter, Esc, Ctrl+Shift+J/K) for the filterable heading picker."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._view: Optional[QListView] = None
+        self._on_activate: Optional[Callable[[], None]] = None
+        self._on_escape: Optional[Callable[[], None]] = None
+
+    def bind(
+        self,
+        view: QListView,
+        on_activate: Callable[[], None],
+        on_escape: Callable[[], None],
+    ) -> None:
+        self._view = view
+        self._on_activate = on_activate
+        self._on_escape = on_escape
+
+    def _step(self, delta: int) -> None:
+        view = self._view
+        model = view.model()
+        count = model.rowCount()
+        if count:
+            row = max(0, min(count - 1, view.currentIndex().row() + delta))
+            view.setCurrentIndex(model.index(row, 0))
+
+    def eventFilter(self, obj, ev):  # type: ignore[override]
+        if ev.type() != QEvent.KeyPress:
+            return False
+        if self._view is None:
+            return False
+        key = ev.key()
+        if key in (Qt.Key_Return, Qt.Key_Enter):
+            self._on_activate()
+            return True
+        if key == Qt.Key_J and ev.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier):
+            self._step(1)
+            return True
+        if key == Qt.Key_K and ev.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier):
+            self._step(-1)
+            return True
+        if key == Qt.Key_Escape:
+            self._on_escape()
+            return True
+        return False
+
+
+class _SaveWorker(QThread):
+    """POST a pre-encoded write request off the GUI thread and keep the outcome."""
+
+    def __init__(self, http: httpx.Client, body: bytes, digest: bytes, revision: int, parent=None) -> None:
+        super().__init__(parent)
+        self._http = http
+        self._body = body
+        self.digest = digest
+        self.revision = revision
+        self.status_code: Optional[int] = None
+        self.error: Optional[httpx.HTTPError] = None
+
+    def run(self) -> None:
+        try:
+            resp = self._http.post(
+                "/api/file/write",
+                content=self._body,
+                headers={"Content-Type": "application/json"},
+            )
+            resp.raise_for_status()
+            self.status_code = resp.status_code
+        except httpx.HTTPError as exc:
+            self.error = exc
+
+
 class PageEditorWindow(QMainWindow):
     """Lightweight single-page editor window (no navigation panes)."""
 
+    # Shared by every window instead of being re-parsed per instance / per picker open.
+    _KS_HEADING = QKeySequence("Ctrl+Shift+Tab")
+    _KS_PLUS = QKeySequence("+")
+    _KS_MINUS = QKeySequence("-")
+    _KS_LINK = QKeySequence("Ctrl+L")
+    _PICKER_QSS = (
+        "QWidget { background: rgba(32,32,32,240); border: 1px solid #666; border-radius: 6px; }"
+        "QLineEdit { border: 1px solid #777; border-radius: 4px; padding: 4px 6px; }"
+        "QListView { background: transparent; color: #f5f5f5; border: none; }"
+        "QListView::item { padding: 4px 6px; }"
+        "QListView::item:selected { background: rgba(90,161,255,80); }"
+    )
+
     def __init__(
         self,
         api_base: str,
@@ -65,6 +267,7 @@ class PageEditorWindow(QMainWindow):
         parent=None,
     ) -> None:
         super().__init__(parent)
+        _prefetch_one_shot_prompt()
         
         # Set window icon explicitly (especially important on Windows)
         from sp.app.main import get_app_icon
@@ -77,8 +280,28 @@ class PageEditorWindow(QMainWindow):
         self._read_only = read_only
         self._open_in_main = open_in_main_callback
         headers = {"X-Local-UI-Token": local_auth_token} if local_auth_token else None
-        self.http = httpx.Client(base_url=self.api_base, timeout=10.0, headers=headers)
+        # One small keep-alive pool for the whole window so reads and autosaves reuse a connection.
+        self.http = httpx.Client(
+            base_url=self.api_base,
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            headers=headers,
+            # A custom transport ignores the Client's limits=, so the pool is configured here.
+            transport=httpx.HTTPTransport(
+                retries=1,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=60.0),
+            ),
+        )
         self._badge_base_style = "border: 1px solid #666; padding: 2px 6px; border-radius: 3px;"
+        self._badge_style_readonly = (
+            self._badge_base_style
+            + " background-color: #9e9e9e; color: #f5f5f5; margin-right: 6px; text-decoration: line-through;"
+        )
+        self._badge_style_dirty = self._badge_base_style + " background-color: #e57373; color: #000; margin-right: 6px;"
+        self._badge_style_clean = self._badge_base_style + " background-color: #81c784; color: #000; margin-right: 6px;"
+        self._dirty_state: Optional[str] = None
+        self._vi_badge_style_insert = self._badge_base_style + " background-color: #ffd54d; color: #000;"
+        self._vi_badge_style_normal = self._badge_base_style + " background-color: transparent;"
+        self._vi_badge_last_style = ""
         self._font_size = config.load_popup_font_size(14)
 
         self.editor = MarkdownEditor()
@@ -104,23 +327,61 @@ class PageEditorWindow(QMainWindow):
         self._vi_enabled = config.load_vi_mode_enabled()
         self._vi_insert_active = False
 
-        self._last_saved_content: Optional[str] = None
+        self._last_saved_hash: bytes = _content_digest(b"")
+        self._md_cache: Optional[tuple[int, str, bytes, bytes]] = None
+        self._save_worker: Optional[_SaveWorker] = None
         self._inline_ai_worker = None
+        self._inline_ai_prompt_overlay = None
+        self._inline_ai_stream_cursor: Optional[QTextCursor] = None
+        self._inline_ai_stream_used = False
+        self._one_shot_overlay = None
+        # Streamed AI tokens are batched into ~30 inserts/second instead of one relayout per token.
+        self._inline_ai_buffer: list[str] = []
+        self._inline_ai_flush_timer = QTimer(self)
+        self._inline_ai_flush_timer.setInterval(33)
+        self._inline_ai_flush_timer.timeout.connect(self._flush_inline_ai_buffer)
+        # Edits only flip a flag; a steady tick saves once the page has been idle long enough.
+        self._dirty_pending = False
+        self._last_edit_ts = 0.0
+        self._autosave_idle_secs = 30.0
         self._autosave_timer = QTimer(self)
-        self._autosave_timer.setInterval(30_000)
-        self._autosave_timer.setSingleShot(True)
-        self._autosave_timer.timeout.connect(lambda: self._save_current_file(auto=True, reason="autosave timer"))
-        self.editor.textChanged.connect(lambda: self._autosave_timer.start())
+        self._autosave_timer.setInterval(5_000)
+        self._autosave_timer.setSingleShot(False)
+        self._autosave_timer.timeout.connect(self._on_autosave_tick)
+        self.editor.textChanged.connect(self._mark_dirty_pending)
         self.editor.document().modificationChanged.connect(lambda _: self._update_dirty_indicator())
         
         # Heading picker state
         self._toc_headings: list[dict] = []
+        self._toc_headings_filtered: Optional[list[dict]] = None
+        self._toc_derived: dict[tuple, tuple] = {}
         self._popup_items: list = []
         self._popup_index: int = -1
         self._popup_mode: Optional[str] = None
         self._heading_popup: Optional[QWidget] = None
         self._heading_popup_label: Optional[QLabel] = None
-        self._heading_popup_list: Optional[QListWidget] = None
+        self._heading_popup_list: Optional[QListView] = None
+        self._heading_popup_model: Optional[_HeadingListModel] = None
+        self._heading_picker: Optional[QWidget] = None
+        self._picker_edit: Optional[QLineEdit] = None
+        self._picker_view: Optional[QListView] = None
+        self._picker_model: Optional[_HeadingListModel] = None
+        self._picker_filter: Optional[_HeadingPickerFilter] = None
+        self._filter_debounce: Optional[QTimer] = None
+        self._pending_cycle_steps = 0
+        self._cycle_timer = QTimer(self)
+        self._cycle_timer.setSingleShot(True)
+        self._cycle_timer.setInterval(16)
+        self._cycle_timer.timeout.connect(self._apply_pending_cycle)
+        self._flash_selection_index: Optional[int] = None
+        # Primary-screen work area for popup placement; dropped when the screen setup changes.
+        self._screen_geo: Optional[QRect] = None
+        self._watched_screen = None
+        QApplication.instance().primaryScreenChanged.connect(self._invalidate_screen_geometry)
+        self._flash_timer = QTimer(self)
+        self._flash_timer.setSingleShot(True)
+        self._flash_timer.setInterval(220)
+        self._flash_timer.timeout.connect(self._clear_heading_flash)
         self.editor.headingsChanged.connect(self._on_headings_changed)
         self.editor.headingPickerRequested.connect(self._handle_heading_picker_request)
 
@@ -132,6 +393,7 @@ class PageEditorWindow(QMainWindow):
         self._geometry_timer = QTimer(self)
         self._geometry_timer.setInterval(400)
         self._geometry_timer.setSingleShot(True)
+        self._geometry_timer.timeout.connect(self._save_geometry)
 
         # Status badges
         self._dirty_status_label = QLabel("")
@@ -145,6 +407,7 @@ class PageEditorWindow(QMainWindow):
         self._vi_status_label = QLabel("INS")
         self._vi_status_label.setObjectName("viStatusLabel")
         self._vi_status_label.setStyleSheet(self._badge_base_style)
+        self._vi_badge_last_style = self._badge_base_style
         self._vi_status_label.setToolTip("Shows when vi insert mode is active")
         self.statusBar().addPermanentWidget(self._vi_status_label, 0)
         self._update_vi_badge_visibility()
@@ -154,27 +417,28 @@ class PageEditorWindow(QMainWindow):
         zoom_out = QShortcut(QKeySequence.ZoomOut, self)
         zoom_in.activated.connect(lambda: self._adjust_font_size(1))
         zoom_out.activated.connect(lambda: self._adjust_font_size(-1))
-        plus_shortcut = QShortcut(QKeySequence("+"), self)
-        minus_shortcut = QShortcut(QKeySequence("-"), self)
+        plus_shortcut = QShortcut(self._KS_PLUS, self)
+        minus_shortcut = QShortcut(self._KS_MINUS, self)
         plus_shortcut.activated.connect(lambda: self._adjust_font_size(1))
         minus_shortcut.activated.connect(lambda: self._adjust_font_size(-1))
         
         # Heading picker shortcuts (window-local to avoid conflicts)
         # Try using QAction instead of QShortcut
         heading_action = QAction("Show Heading Picker", self)
-        heading_action.setShortcut(QKeySequence("Ctrl+Shift+Tab"))
+        heading_action.setShortcut(self._KS_HEADING)
         heading_action.setShortcutContext(Qt.WidgetWithChildrenShortcut)
-        heading_action.triggered.connect(lambda: (print("[PageEditor] Heading action triggered"), self._cycle_popup("heading", reverse=False)))
+        heading_action.triggered.connect(lambda: self._queue_heading_cycle(reverse=False))
         self.addAction(heading_action)
 
         link_action = QAction("Insert Link…", self)
-        link_action.setShortcut(QKeySequence("Ctrl+L"))
+        link_action.setShortcut(self._KS_LINK)
         link_action.setShortcutContext(Qt.WidgetWithChildrenShortcut)
         link_action.triggered.connect(self._insert_link)
         self.addAction(link_action)
         
         # Install event filter to catch Control key release for popup navigation
         self.installEventFilter(self)
+        self._autosave_timer.start()
 
     def set_read_only(self, read_only: bool) -> None:
         """Toggle read-only state and refresh window badges/title."""
@@ -258,15 +522,10 @@ class PageEditorWindow(QMainWindow):
         if tracer:
             tracer.mark("api read start")
         try:
-            resp = self.http.post("/api/file/read", json={"path": self._source_path})
-            resp.raise_for_status()
-            content = resp.json().get("content", "")
+            content_bytes = self._fetch_page_bytes()
+            content = content_bytes.decode("utf-8")
             if tracer:
-                try:
-                    content_len = len(content.encode("utf-8"))
-                except Exception:
-                    content_len = len(content or "")
-                tracer.mark(f"api read complete bytes={content_len}")
+                tracer.mark(f"api read complete bytes={len(content_bytes)}")
             try:
                 self.editor.set_page_load_logger(tracer)
             except Exception:
@@ -275,7 +534,7 @@ class PageEditorWindow(QMainWindow):
             if tracer:
                 tracer.mark("editor content applied")
             self.editor.document().setModified(False)
-            self._last_saved_content = content
+            self._last_saved_hash = _content_digest(content_bytes)
             self.statusBar().showMessage("Ready")
             if tracer:
                 tracer.end("ready for edit (popup)")
@@ -284,6 +543,18 @@ class PageEditorWindow(QMainWindow):
                 tracer.mark(f"api read failed ({exc})")
             QMessageBox.critical(self, "Error", f"Failed to load page: {exc}")
 
+    def _fetch_page_bytes(self) -> bytes:
+        """Return the page as UTF-8 bytes, preferring the plain-text route when the server has it."""
+        resp = self.http.get("/api/file/text", params={"path": self._source_path})
+        if resp.status_code in (404, 405):
+            # Remote or older servers may not expose /api/file/text; a 404 there is
+            # indistinguishable from a missing page, so let /api/file/read decide.
+            resp = self.http.post("/api/file/read", json={"path": self._source_path})
+            resp.raise_for_status()
+            return (json.loads(resp.content).get("content") or "").encode("utf-8")
+        resp.raise_for_status()
+        return resp.content
+
     def _update_title(self) -> None:
         label = Path(self._source_path).name or self._source_path
         suffix = "StillPoint Editor"
@@ -293,9 +564,37 @@ class PageEditorWindow(QMainWindow):
             self.setWindowTitle(f"{label} | {suffix}")
         self._update_dirty_indicator()
 
+    def _cached_markdown(self) -> tuple[str, bytes, bytes]:
+        """Serialize the document once per revision; return the text, UTF-8 bytes and digest."""
+        rev = self.editor.document().revision()
+        cache = self._md_cache
+        if cache is not None and cache[0] == rev:
+            return cache[1], cache[2], cache[3]
+        markdown = self.editor.to_markdown()
+        data = markdown.encode("utf-8")
+        digest = _content_digest(data)
+        self._md_cache = (rev, markdown, data, digest)
+        return markdown, data, digest
+
     def _is_dirty(self) -> bool:
-        current = self.editor.to_markdown()
-        return current != (self._last_saved_content or "")
+        if not self.editor.document().isModified():
+            return False
+        # Qt's modified flag stays set when edits are reverted by hand, so confirm by comparing
+        # the digest of the current markdown with the one taken at the last load or save.
+        _markdown, _data, digest = self._cached_markdown()
+        return digest != self._last_saved_hash
+
+    def _mark_dirty_pending(self) -> None:
+        self._dirty_pending = True
+        self._last_edit_ts = time.monotonic()
+
+    def _on_autosave_tick(self) -> None:
+        if not self._dirty_pending:
+            return
+        if time.monotonic() - self._last_edit_ts < self._autosave_idle_secs:
+            return
+        self._dirty_pending = False
+        self._save_current_file(auto=True, reason="autosave timer")
 
     def _ensure_writable(self, auto: bool) -> bool:
         if not self._read_only:
@@ -314,43 +613,100 @@ class PageEditorWindow(QMainWindow):
             return
         if not self._ensure_writable(auto):
             return
-        payload = {"path": self._source_path, "content": self.editor.to_markdown()}
-        try:
-            payload_bytes = len(payload["content"].encode("utf-8"))
-        except Exception:
-            payload_bytes = len(payload["content"] or "")
+        background = auto and reason in ("autosave timer", "focus lost")
+        if self._save_worker is not None:
+            if background:
+                # A write is already in flight; let a later autosave tick pick this up.
+                self._dirty_pending = True
+                return
+            self._finish_background_save()
+        content, content_bytes, digest = self._cached_markdown()
+        revision = self.editor.document().revision()
+        payload_bytes = len(content_bytes)
+        # Serialize the request body once, straight to UTF-8, instead of letting httpx redo it.
+        body = json.dumps(
+            {"path": self._source_path, "content": content},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
         mode = "auto" if auto else "manual"
         reason_label = reason or "save"
         try:
             rel = Path(self._source_path.lstrip("/"))
             if len(rel.parts) == 1 and rel.suffix.lower() in PAGE_SUFFIXES:
-                trace = "".join(traceback.format_stack(limit=12))
-                print(f"[StillPoint Popup] Invalid root write requested path={self._source_path} reason={reason_label}\n{trace}")
+                logger.warning(
+                    "Invalid root write requested path=%s reason=%s", self._source_path, reason_label
+                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Root write stack:\n%s", "".join(traceback.format_stack(limit=12)))
         except Exception:
             pass
-        print(
-            f"[StillPoint Popup] Write request reason={reason_label} mode={mode} path={self._source_path} "
-            f"bytes={payload_bytes}"
+        logger.debug(
+            "Write request reason=%s mode=%s path=%s bytes=%d",
+            reason_label,
+            mode,
+            self._source_path,
+            payload_bytes,
         )
+        if background:
+            worker = _SaveWorker(self.http, body, digest, revision, parent=self)
+            worker.finished.connect(lambda w=worker: self._on_save_worker_finished(w))
+            self._save_worker = worker
+            worker.start()
+            return
         try:
-            resp = self.http.post("/api/file/write", json=payload)
+            resp = self.http.post(
+                "/api/file/write",
+                content=body,
+                headers={"Content-Type": "application/json"},
+            )
             resp.raise_for_status()
-            print(f"[StillPoint Popup] Write OK {self._source_path} status={resp.status_code}")
         except httpx.HTTPError as exc:
-            try:
-                body = exc.response.text if exc.response else str(exc)
-                status = exc.response.status_code if exc.response else "n/a"
-                print(f"[StillPoint Popup] Write FAILED {self._source_path} status={status} body={body}")
-            except Exception:
-                print(f"[StillPoint Popup] Write FAILED {self._source_path}: {exc}")
-            if not auto:
-                QMessageBox.critical(self, "Save Failed", f"Failed to save: {exc}")
+            self._report_write_failure(exc, auto)
             return
-        self._last_saved_content = payload["content"]
+        self._record_write_success(digest, revision, resp.status_code)
+
+    def _on_save_worker_finished(self, worker: _SaveWorker) -> None:
+        if worker is not self._save_worker:
+            # Already handled synchronously by _finish_background_save().
+            return
+        self._apply_save_worker_result(worker)
+
+    def _finish_background_save(self) -> None:
+        """Block until an in-flight autosave completes so writes stay ordered."""
+        worker = self._save_worker
+        if worker is None:
+            return
+        worker.wait()
+        self._apply_save_worker_result(worker)
+
+    def _apply_save_worker_result(self, worker: _SaveWorker) -> None:
+        self._save_worker = None
+        if worker.error is not None:
+            self._report_write_failure(worker.error, auto=True)
+        else:
+            self._record_write_success(worker.digest, worker.revision, worker.status_code)
+        worker.deleteLater()
+
+    def _report_write_failure(self, exc: httpx.HTTPError, auto: bool) -> None:
         try:
-            self.editor.document().setModified(False)
+            body = exc.response.text if exc.response else str(exc)
+            status = exc.response.status_code if exc.response else "n/a"
+            logger.warning("Write FAILED %s status=%s body=%s", self._source_path, status, body)
         except Exception:
-            pass
+            logger.warning("Write FAILED %s: %s", self._source_path, exc)
+        if not auto:
+            QMessageBox.critical(self, "Save Failed", f"Failed to save: {exc}")
+
+    def _record_write_success(self, digest: bytes, revision: int, status_code: Optional[int]) -> None:
+        logger.debug("Write OK %s status=%s", self._source_path, status_code)
+        self._last_saved_hash = digest
+        # Edits made while a background write was in flight keep the document modified.
+        if self.editor.document().revision() == revision:
+            try:
+                self.editor.document().setModified(False)
+            except Exception:
+                pass
         self.statusBar().showMessage("Saved", 2000)
         # Notify parent/main window to refresh if editing the same page
         try:
@@ -380,7 +736,7 @@ class PageEditorWindow(QMainWindow):
             selected_text = selected_text.replace('\u2029', ' ').replace('\n', ' ').replace('\r', ' ').strip()
 
         def _restore_cursor() -> QTextCursor:
-            doc_len = len(self.editor.toPlainText())
+            doc_len = self.editor.document().characterCount() - 1
             anchor = max(0, min(saved_anchor_pos, doc_len))
             pos = max(0, min(saved_cursor_pos, doc_len))
             cursor = QTextCursor(self.editor.document())
@@ -407,7 +763,7 @@ class PageEditorWindow(QMainWindow):
             link_name = dlg.selected_link_name()
             if colon_path:
                 if selection_range:
-                    doc_len = len(self.editor.toPlainText())
+                    doc_len = self.editor.document().characterCount() - 1
                     start = max(0, min(selection_range[0], doc_len))
                     end = max(0, min(selection_range[1], doc_len))
                     restore_cursor.setPosition(start)
@@ -429,24 +785,24 @@ class PageEditorWindow(QMainWindow):
         if not hasattr(self, "_dirty_status_label"):
             return
         if self._read_only:
+            state = "ro"
+        else:
+            state = "dirty" if self._is_dirty() else "clean"
+        # Restyling forces a repolish, so only touch the badge when its state flips.
+        if state == self._dirty_state:
+            return
+        self._dirty_state = state
+        if state == "ro":
             self._dirty_status_label.setText("O/")
-            self._dirty_status_label.setStyleSheet(
-                self._badge_base_style + " background-color: #9e9e9e; color: #f5f5f5; margin-right: 6px; text-decoration: line-through;"
-            )
+            self._dirty_status_label.setStyleSheet(self._badge_style_readonly)
             self._dirty_status_label.setToolTip("Read-only: changes cannot be saved in this window")
-            return
-        dirty = self._is_dirty()
-        if dirty:
+        elif state == "dirty":
             self._dirty_status_label.setText("●")
-            self._dirty_status_label.setStyleSheet(
-                self._badge_base_style + " background-color: #e57373; color: #000; margin-right: 6px;"
-            )
+            self._dirty_status_label.setStyleSheet(self._badge_style_dirty)
             self._dirty_status_label.setToolTip("Unsaved changes")
         else:
             self._dirty_status_label.setText("●")
-            self._dirty_status_label.setStyleSheet(
-                self._badge_base_style + " background-color: #81c784; color: #000; margin-right: 6px;"
-            )
+            self._dirty_status_label.setStyleSheet(self._badge_style_clean)
             self._dirty_status_label.setToolTip("All changes saved")
 
     def _adjust_font_size(self, delta: int) -> None:
@@ -470,14 +826,9 @@ class PageEditorWindow(QMainWindow):
         if has_selection:
             selection_text = cursor.selectedText().replace("\u2029", "\n").strip()
         try:
-            from .ai_chat_panel import ServerManager
+            ServerManager, OneShotPromptOverlay = _ai_assist_imports()
         except Exception:
-            self.statusBar().showMessage("AI worker unavailable.", 4000)
-            return
-        try:
-            from .one_shot_overlay import OneShotPromptOverlay
-        except Exception:
-            self.statusBar().showMessage("One-Shot overlay unavailable.", 4000)
+            self.statusBar().showMessage("AI assist unavailable.", 4000)
             return
 
         server_config: dict = {}
@@ -512,11 +863,8 @@ class PageEditorWindow(QMainWindow):
                 replace_cursor = QTextCursor(doc)
                 replace_cursor.setPosition(start_pos)
                 replace_cursor.setPosition(end_pos, QTextCursor.KeepAnchor)
-                replace_cursor.beginEditBlock()
-                if start_pos != end_pos:
-                    replace_cursor.removeSelectedText()
+                # insertText replaces the selection in one edit, giving a single undo step.
                 replace_cursor.insertText(assistant_text)
-                replace_cursor.endEditBlock()
                 self.editor.setFocus()
             except Exception:
                 pass
@@ -529,10 +877,7 @@ class PageEditorWindow(QMainWindow):
             system_prompt=system_prompt,
             on_accept=_accept_insert,
         )
-        try:
-            self._one_shot_overlay = overlay
-        except Exception:
-            pass
+        self._one_shot_overlay = overlay
         try:
             self.editor.push_focus_lost_suppression()
         except Exception:
@@ -546,10 +891,7 @@ class PageEditorWindow(QMainWindow):
                 self.editor.pop_focus_lost_suppression()
             except Exception:
                 pass
-            try:
-                setattr(self, "_one_shot_overlay", None)
-            except Exception:
-                pass
+            self._one_shot_overlay = None
 
         try:
             overlay.finished.connect(lambda *_: _overlay_cleanup())
@@ -567,8 +909,6 @@ class PageEditorWindow(QMainWindow):
 
     def _show_editor_context_menu(self, pos) -> None:
         """Show context menu with Edit operations matching main window."""
-        from PySide6.QtWidgets import QMenu
-        
         # Get standard context menu (Undo, Redo, Cut, Copy, Paste, Delete, Select All)
         base_menu = self.editor.createStandardContextMenu()
         
@@ -623,121 +963,82 @@ class PageEditorWindow(QMainWindow):
 
     def _on_headings_changed(self, headings: list[dict]) -> None:
         """Store headings when editor parses them."""
-        self._toc_headings = list(headings or [])
-        print(f"[PageEditor] Headings changed: {len(self._toc_headings)} headings")
+        # Precompute the filter key and display text here so the picker doesn't redo it per keystroke.
+        # Headings the edit didn't touch reuse the previous outline's derived fields.
+        previous = self._toc_derived
+        derived: dict[tuple, tuple] = {}
+        toc: list[dict] = []
+        for h in headings or []:
+            if not h:
+                continue
+            title = h.get("title") or "(heading)"
+            level = h.get("level", 1)
+            key = (title, level, h.get("line", 1))
+            fields = previous.get(key)
+            if fields is None:
+                title_cf = title.casefold()
+                indent = _LEVEL_INDENTS[max(0, min(4, int(level) - 1))]
+                fields = (title_cf, _trigrams(title_cf), f"{indent}{title}  (line {key[2]})")
+            derived[key] = fields
+            toc.append({**h, "_title_cf": fields[0], "_trigrams": fields[1], "_display": fields[2]})
+        self._toc_derived = derived
+        self._toc_headings = toc
+        self._toc_headings_filtered = None
+        logger.debug("Headings changed: %d headings", len(toc))
 
     def _handle_heading_picker_request(self, global_point, prefer_above: bool) -> None:
         """Handle Ctrl+Alt+T heading picker request from editor - show filterable picker."""
-        print(f"[PageEditor] _handle_heading_picker_request called")
         self._show_filterable_heading_picker(global_point, prefer_above)
 
-    def _show_filterable_heading_picker(self, global_pos, prefer_above: bool = False) -> None:
-        """Show a filterable heading picker near the cursor (vi 't')."""
-        headings = self._toc_headings or []
-        if not headings:
-            print("[PageEditor] No headings to show")
+    def _ensure_filter_picker(self) -> None:
+        """Create the filterable heading picker once; later opens only refill its model."""
+        if self._heading_picker is not None:
             return
-        # Dispose any existing picker
-        if hasattr(self, "_heading_picker") and self._heading_picker:
-            try:
-                self._heading_picker.close()
-            except Exception:
-                pass
         popup = QWidget(self, Qt.Popup | Qt.FramelessWindowHint | Qt.NoDropShadowWindowHint)
-        popup.setStyleSheet(
-            "QWidget { background: rgba(32,32,32,240); border: 1px solid #666; border-radius: 6px; }"
-            "QLineEdit { border: 1px solid #777; border-radius: 4px; padding: 4px 6px; }"
-            "QListWidget { background: transparent; color: #f5f5f5; border: none; }"
-            "QListWidget::item { padding: 4px 6px; }"
-            "QListWidget::item:selected { background: rgba(90,161,255,80); }"
-        )
+        popup.setStyleSheet(self._PICKER_QSS)
         layout = QVBoxLayout(popup)
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(6)
-        filter_edit = QLineEdit(popup)
-        filter_edit.setPlaceholderText("Filter headings…")
-        list_widget = QListWidget(popup)
-        layout.addWidget(filter_edit)
-        layout.addWidget(list_widget, 1)
-
-        def populate(query: str = "") -> None:
-            list_widget.clear()
-            needle = query.lower().strip()
-            for h in headings:
-                title = h.get("title") or "(heading)"
-                if needle and needle not in title.lower():
-                    continue
-                line = h.get("line", 1)
-                level = max(1, min(5, int(h.get("level", 1))))
-                indent = "    " * (level - 1)
-                item = QListWidgetItem(f"{indent}{title}  (line {line})")
-                item.setData(Qt.UserRole, h)
-                list_widget.addItem(item)
-            if list_widget.count():
-                list_widget.setCurrentRow(0)
-
-        def activate_current() -> None:
-            item = list_widget.currentItem()
-            if not item:
-                popup.close()
-                return
-            data = item.data(Qt.UserRole) or {}
-            try:
-                pos = int(data.get("position", 0))
-            except Exception:
-                pos = 0
-            if pos <= 0:
-                try:
-                    line = int(data.get("line", 1))
-                except Exception:
-                    line = 1
-                block = self.editor.document().findBlockByNumber(max(0, line - 1))
-                if block.isValid():
-                    pos = block.position()
-            cursor = self.editor.textCursor()
-            cursor.setPosition(max(0, pos))
-            self.editor.setTextCursor(cursor)
-            self.editor.ensureCursorVisible()
-            popup.close()
-            QTimer.singleShot(0, lambda: self.editor.setFocus(Qt.OtherFocusReason))
-
-        filter_edit.textChanged.connect(populate)
-        list_widget.itemDoubleClicked.connect(lambda *_: activate_current())
-        list_widget.itemActivated.connect(lambda *_: activate_current())
-
-        editor_ref = self.editor
-
-        class _PickerFilter(QObject):
-            def eventFilter(self, obj, ev):  # type: ignore[override]
-                if ev.type() == QEvent.KeyPress:
-                    if ev.key() in (Qt.Key_Return, Qt.Key_Enter):
-                        activate_current()
-                        return True
-                    if ev.key() == Qt.Key_J and ev.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier):
-                        row = list_widget.currentRow()
-                        if list_widget.count():
-                            list_widget.setCurrentRow(min(list_widget.count() - 1, row + 1))
-                        return True
-                    if ev.key() == Qt.Key_K and ev.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier):
-                        row = list_widget.currentRow()
-                        if list_widget.count():
-                            list_widget.setCurrentRow(max(0, row - 1))
-                        return True
-                    if ev.key() == Qt.Key_Escape:
-                        popup.close()
-                        if editor_ref:
-                            QTimer.singleShot(0, lambda: editor_ref.setFocus(Qt.OtherFocusReason))
-                        return True
-                return False
-
-        filt = _PickerFilter(popup)
-        filter_edit.installEventFilter(filt)
-        list_widget.installEventFilter(filt)
-        populate("")
+        self._picker_edit = QLineEdit(popup)
+        self._picker_edit.setPlaceholderText("Filter headings…")
+        self._picker_model = _HeadingListModel(popup)
+        self._picker_view = _make_heading_view(popup, self._picker_model)
+        layout.addWidget(self._picker_edit)
+        layout.addWidget(self._picker_view, 1)
+        # Refilter once the user pauses typing instead of on every keystroke.
+        self._filter_debounce = QTimer(popup)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(150)
+        self._filter_debounce.timeout.connect(lambda: self._filter_picker_rows(self._picker_edit.text()))
+        self._picker_edit.textChanged.connect(lambda _text: self._filter_debounce.start())
+        self._picker_view.activated.connect(lambda *_: self._activate_picker_selection())
+        self._picker_filter = _HeadingPickerFilter(self)
+        self._picker_filter.bind(self._picker_view, self._accept_picker_selection, self._dismiss_picker)
+        self._picker_edit.installEventFilter(self._picker_filter)
+        self._picker_view.installEventFilter(self._picker_filter)
+        self._heading_picker = popup
+
+    def _show_filterable_heading_picker(self, global_pos, prefer_above: bool = False) -> None:
+        """Show a filterable heading picker near the cursor (vi 't')."""
+        headings = self._toc_headings or []
+        if not headings:
+            logger.debug("No headings to show")
+            return
+        self._ensure_filter_picker()
+        popup = self._heading_picker
+        if popup.isVisible():
+            popup.hide()
+        self._filter_debounce.stop()
+        self._picker_edit.blockSignals(True)
+        self._picker_edit.clear()
+        self._picker_edit.blockSignals(False)
+        self._picker_model.set_headings(headings)
+        self._filter_picker_rows("", select_first=True)
+        row_count = self._picker_model.rowCount()
 
         # Position near cursor, above or below based on preference and space
-        popup.resize(360, min(320, max(160, list_widget.sizeHintForRow(0) * min(8, list_widget.count()) + 64)))
-        screen = QApplication.primaryScreen().availableGeometry()
+        popup.resize(360, min(320, max(160, self._picker_view.sizeHintForRow(0) * min(8, row_count) + 64)))
+        screen = self._available_screen_geometry()
         size = popup.size()
         x = max(screen.x(), min(global_pos.x(), screen.x() + screen.width() - size.width()))
         if prefer_above:
@@ -751,13 +1052,56 @@ class PageEditorWindow(QMainWindow):
         popup.move(x, y)
         popup.show()
         popup.raise_()
-        filter_edit.setFocus()
-        self._heading_picker = popup
-        print(f"[PageEditor] Filterable picker shown with {list_widget.count()} headings")
+        self._picker_edit.setFocus()
+        logger.debug("Filterable picker shown with %d headings", row_count)
+
+    def _filter_picker_rows(self, query: str, select_first: bool = False) -> None:
+        changed = self._picker_model.set_filter(query)
+        if not self._picker_model.rowCount():
+            return
+        # Keep the user's row when the filter left the rows alone; a reset drops the selection anyway.
+        if changed or select_first or not self._picker_view.currentIndex().isValid():
+            self._picker_view.setCurrentIndex(self._picker_model.index(0, 0))
+
+    def _activate_picker_selection(self) -> None:
+        data = self._picker_view.currentIndex().data(Qt.UserRole)
+        self._heading_picker.close()
+        if not data:
+            return
+        cursor = self.editor.textCursor()
+        cursor.setPosition(self._heading_position(data))
+        self.editor.setTextCursor(cursor)
+        self.editor.ensureCursorVisible()
+        QTimer.singleShot(0, lambda: self.editor.setFocus(Qt.OtherFocusReason))
+
+    def _accept_picker_selection(self) -> None:
+        # Apply a filter the user typed just before Enter so the right row is activated.
+        if self._filter_debounce.isActive():
+            self._filter_debounce.stop()
+            self._filter_picker_rows(self._picker_edit.text())
+        self._activate_picker_selection()
+
+    def _dismiss_picker(self) -> None:
+        self._heading_picker.close()
+        QTimer.singleShot(0, lambda: self.editor.setFocus(Qt.OtherFocusReason))
+
+    def _available_screen_geometry(self) -> QRect:
+        if self._screen_geo is None:
+            screen = QApplication.primaryScreen()
+            if screen is not self._watched_screen:
+                screen.availableGeometryChanged.connect(self._invalidate_screen_geometry)
+                self._watched_screen = screen
+            self._screen_geo = screen.availableGeometry()
+        return self._screen_geo
+
+    def _invalidate_screen_geometry(self, *_args) -> None:
+        self._screen_geo = None
 
     def _heading_popup_candidates(self) -> list[dict]:
         """Return headings for current page (excluding horizontal rules)."""
-        return [h for h in self._toc_headings if h and h.get("type") != "hr"]
+        if self._toc_headings_filtered is None:
+            self._toc_headings_filtered = [h for h in self._toc_headings if h and h.get("type") != "hr"]
+        return self._toc_headings_filtered
 
     def _ensure_heading_popup(self) -> None:
         """Create heading popup widget if it doesn't exist."""
@@ -771,62 +1115,59 @@ class PageEditorWindow(QMainWindow):
             self._heading_popup_label = QLabel(popup)
             self._heading_popup_label.setStyleSheet("color: #f5f5f5; font-weight: bold;")
             layout.addWidget(self._heading_popup_label)
-            self._heading_popup_list = QListWidget(popup)
+            self._heading_popup_model = _HeadingListModel(popup)
+            self._heading_popup_list = _make_heading_view(popup, self._heading_popup_model)
             self._heading_popup_list.setStyleSheet(
-                "QListWidget { background: transparent; color: #f5f5f5; border: none; }"
-                "QListWidget::item { padding: 4px 6px; }"
-                "QListWidget::item:selected { background: rgba(255,255,255,40); }"
+                "QListView { background: transparent; color: #f5f5f5; border: none; }"
+                "QListView::item { padding: 4px 6px; }"
+                "QListView::item:selected { background: rgba(255,255,255,40); }"
             )
             layout.addWidget(self._heading_popup_list)
-            self._heading_popup_list.itemActivated.connect(self._activate_heading_popup_selection)
+            self._heading_popup_list.activated.connect(self._on_heading_popup_activated)
             self._heading_popup = popup
 
     def _show_heading_popup(self) -> None:
         """Display the heading popup with current items and selection."""
-        print(f"[PageEditor] _show_heading_popup called")
         self._ensure_heading_popup()
         if not self._heading_popup or not self._heading_popup_label or not self._heading_popup_list:
-            print("[PageEditor] Popup widgets not initialized properly")
+            logger.debug("Heading popup widgets not initialized")
             return
-        self._heading_popup_list.clear()
-        if self._popup_mode == "heading":
-            for heading in self._popup_items:
-                title = heading.get("title") or "(heading)"
-                line = heading.get("line", 1)
-                level = max(1, min(5, int(heading.get("level", 1))))
-                indent = "    " * (level - 1)
-                item = QListWidgetItem(f"{indent}{title}  (line {line})")
-                self._heading_popup_list.addItem(item)
-            label = "Headings"
-        else:
+        if self._popup_mode != "heading":
             return
-        if 0 <= self._popup_index < self._heading_popup_list.count():
-            self._heading_popup_list.setCurrentRow(self._popup_index)
-        self._heading_popup_label.setText(label)
-        editor_rect = self.editor.rect()
-        top_left = self.editor.mapToGlobal(editor_rect.topLeft())
-        popup_width = max(self._heading_popup.sizeHint().width(), editor_rect.width() // 3)
-        min_height = int(editor_rect.height() * 0.5)
-        popup_height = max(self._heading_popup.sizeHint().height(), min_height)
-        x = top_left.x() + editor_rect.width() // 2 - popup_width // 2
-        y = top_left.y() + 24
-        self._heading_popup.resize(popup_width, popup_height)
-        self._heading_popup.move(x, y)
+        model = self._heading_popup_model
+        popup = self._heading_popup
+        # Refill, reselect, relabel and reposition as one repaint while cycling an open popup.
+        popup.setUpdatesEnabled(False)
+        try:
+            model.set_headings(self._popup_items)
+            if 0 <= self._popup_index < model.rowCount():
+                self._heading_popup_list.setCurrentIndex(model.index(self._popup_index, 0))
+            self._heading_popup_label.setText("Headings")
+            editor_rect = self.editor.rect()
+            top_left = self.editor.mapToGlobal(editor_rect.topLeft())
+            popup_width = max(popup.sizeHint().width(), editor_rect.width() // 3)
+            min_height = int(editor_rect.height() * 0.5)
+            popup_height = max(popup.sizeHint().height(), min_height)
+            x = top_left.x() + editor_rect.width() // 2 - popup_width // 2
+            y = top_left.y() + 24
+            popup.resize(popup_width, popup_height)
+            popup.move(x, y)
+        finally:
+            popup.setUpdatesEnabled(True)
         self._heading_popup.show()
         self._heading_popup.raise_()
         self._heading_popup_list.setFocus()
-        print(f"[PageEditor] Popup shown and focused")
 
     def _cycle_popup(self, mode: str, reverse: bool = False) -> None:
         """Cycle through heading popup items."""
-        print(f"[PageEditor] _cycle_popup called, mode={mode}")
+        logger.debug("Cycle popup mode=%s", mode)
         if mode == "heading":
             items = self._heading_popup_candidates()
-            print(f"[PageEditor] Found {len(items)} heading candidates")
+            logger.debug("Found %d heading candidates", len(items))
         else:
             return
         if not items:
-            print("[PageEditor] No items to show, returning")
+            logger.debug("No popup items to show")
             return
         if self._popup_mode != mode:
             self._popup_items = items
@@ -841,41 +1182,74 @@ class PageEditorWindow(QMainWindow):
                 self._popup_index = (self._popup_index + delta) % len(items)
         self._show_heading_popup()
 
+    def _on_heading_popup_activated(self, index: QModelIndex) -> None:
+        """Follow a click/Enter on a popup row rather than the last cycled index."""
+        if index.isValid():
+            self._popup_index = index.row()
+        self._activate_heading_popup_selection()
+
+    def _queue_heading_cycle(self, reverse: bool = False) -> None:
+        """Fold rapid/auto-repeated cycle steps into one popup update per frame."""
+        if self._popup_mode != "heading" or not self._popup_items:
+            self._cycle_popup("heading", reverse=reverse)
+            return
+        self._pending_cycle_steps += -1 if reverse else 1
+        if not self._cycle_timer.isActive():
+            self._cycle_timer.start()
+
+    def _apply_pending_cycle(self) -> None:
+        self._cycle_timer.stop()
+        steps = self._pending_cycle_steps
+        self._pending_cycle_steps = 0
+        if not steps or self._popup_mode != "heading" or not self._popup_items:
+            return
+        self._popup_index = (max(0, self._popup_index) + steps) % len(self._popup_items)
+        self._show_heading_popup()
+
     def _activate_heading_popup_selection(self) -> None:
         """Navigate to selected heading and hide popup."""
-        print(f"[PageEditor] _activate_heading_popup_selection called")
         if not self._popup_items or self._popup_index < 0 or not self._popup_mode:
-            print(f"[PageEditor] Invalid state: items={len(self._popup_items) if self._popup_items else 0}, index={self._popup_index}, mode={self._popup_mode}")
+            logger.debug(
+                "Heading popup invalid state: items=%d index=%d mode=%s",
+                len(self._popup_items or ()),
+                self._popup_index,
+                self._popup_mode,
+            )
             self._hide_heading_popup()
             return
         target = self._popup_items[self._popup_index]
         mode = self._popup_mode
-        print(f"[PageEditor] Navigating to heading: {target.get('title', 'unknown')} at line {target.get('line', '?')}")
+        logger.debug("Navigating to heading %r at line %s", target.get("title"), target.get("line"))
         self._hide_heading_popup()
         if mode == "heading" and target:
-            try:
-                pos = int(target.get("position", 0))
-            except Exception:
-                pos = 0
-            if pos <= 0:
-                try:
-                    line = int(target.get("line", 1))
-                except Exception:
-                    line = 1
-                block = self.editor.document().findBlockByNumber(max(0, line - 1))
-                if block.isValid():
-                    pos = block.position()
-            print(f"[PageEditor] Setting cursor to position {pos}")
+            pos = self._heading_position(target)
+            logger.debug("Setting cursor to position %d", pos)
             cursor = self.editor.textCursor()
-            cursor.setPosition(max(0, pos))
+            cursor.setPosition(pos)
             self.editor.setTextCursor(cursor)
             self.editor.ensureCursorVisible()
             self._flash_heading(cursor)
             self.editor.setFocus()
-            print(f"[PageEditor] Navigation complete")
+
+    def _heading_position(self, heading: dict) -> int:
+        """Document offset of a TOC heading, as recorded when the outline was built."""
+        doc = self.editor.document()
+        pos = heading.get("position")
+        if not isinstance(pos, int):
+            # MarkdownEditor always records positions; the line walk only covers entries without one.
+            try:
+                line = int(heading.get("line", 1))
+            except Exception:
+                line = 1
+            block = doc.findBlockByNumber(max(0, line - 1))
+            pos = block.position() if block.isValid() else 0
+        # The outline is debounced, so a trailing edit can leave it pointing past the end.
+        return max(0, min(pos, doc.characterCount() - 1))
 
     def _hide_heading_popup(self) -> None:
         """Hide the heading popup and reset state."""
+        self._cycle_timer.stop()
+        self._pending_cycle_steps = 0
         self._popup_items = []
         self._popup_index = -1
         self._popup_mode = None
@@ -884,6 +1258,8 @@ class PageEditorWindow(QMainWindow):
 
     def _flash_heading(self, cursor: QTextCursor) -> None:
         """Briefly highlight the heading line."""
+        if self._flash_selection_index is not None:
+            self._clear_heading_flash()
         try:
             sel = QTextEdit.ExtraSelection()
             sel.cursor = cursor
@@ -891,21 +1267,31 @@ class PageEditorWindow(QMainWindow):
             sel.format.setBackground(QColor("#ffd54f"))
             sel.format.setProperty(QTextFormat.FullWidthSelection, True)
             sel.format.setProperty(QTextFormat.UserProperty, 9991)
-            current = self.editor.extraSelections()
-            self.editor.setExtraSelections(current + [sel])
-
-            def clear_flash() -> None:
-                try:
-                    keep = [
-                        s
-                        for s in self.editor.extraSelections()
-                        if s.format.property(QTextFormat.UserProperty) != 9991
-                    ]
-                    self.editor.setExtraSelections(keep)
-                except Exception:
-                    pass
-
-            QTimer.singleShot(220, clear_flash)
+            selections = self.editor.extraSelections()
+            self._flash_selection_index = len(selections)
+            selections.append(sel)
+            self.editor.setExtraSelections(selections)
+            self._flash_timer.start()
+        except Exception:
+            self._flash_selection_index = None
+
+    def _clear_heading_flash(self) -> None:
+        """Drop the flash selection from the slot it was appended to."""
+        self._flash_timer.stop()
+        index = self._flash_selection_index
+        self._flash_selection_index = None
+        if index is None:
+            return
+        try:
+            selections = self.editor.extraSelections()
+            if index < len(selections) and selections[index].format.property(QTextFormat.UserProperty) == 9991:
+                del selections[index]
+            else:
+                # The editor rebuilt its selections (vi cursor, rules) since the flash; find it by tag.
+                selections = [
+                    s for s in selections if s.format.property(QTextFormat.UserProperty) != 9991
+                ]
+            self.editor.setExtraSelections(selections)
         except Exception:
             pass
 
@@ -931,18 +1317,18 @@ class PageEditorWindow(QMainWindow):
         if not self._vi_enabled:
             self._vi_status_label.hide()
             return
-        style = self._badge_base_style
-        if insert_active:
-            style += " background-color: #ffd54d; color: #000;"
-        else:
-            style += " background-color: transparent;"
+        style = self._vi_badge_style_insert if insert_active else self._vi_badge_style_normal
+        # Re-setting an identical sheet still re-polishes the label, so skip no-op updates.
+        if style == self._vi_badge_last_style:
+            return
+        self._vi_badge_last_style = style
         self._vi_status_label.setStyleSheet(style)
 
     def _open_inline_ai_prompt(self, anchor: QPoint, insert_pos: int) -> None:
         if not config.load_enable_ai_chats():
             self.statusBar().showMessage("Enable AI Chats in Preferences to use inline prompts.", 4000)
             return
-        if getattr(self, "_inline_ai_worker", None):
+        if self._inline_ai_worker is not None:
             self.statusBar().showMessage("Inline AI is already streaming.", 3000)
             return
         try:
@@ -955,10 +1341,7 @@ class PageEditorWindow(QMainWindow):
             self._start_inline_ai_stream(prompt, insert_pos)
 
         overlay = InlineAIPromptOverlay(parent=self, on_send=_send, anchor=QPoint(anchor.x(), anchor.y() + 10))
-        try:
-            self._inline_ai_prompt_overlay = overlay
-        except Exception:
-            pass
+        self._inline_ai_prompt_overlay = overlay
         try:
             self.editor.push_focus_lost_suppression()
         except Exception:
@@ -972,10 +1355,7 @@ class PageEditorWindow(QMainWindow):
                 self.editor.pop_focus_lost_suppression()
             except Exception:
                 pass
-            try:
-                setattr(self, "_inline_ai_prompt_overlay", None)
-            except Exception:
-                pass
+            self._inline_ai_prompt_overlay = None
 
         try:
             overlay.finished.connect(lambda *_: _overlay_cleanup())
@@ -986,37 +1366,14 @@ class PageEditorWindow(QMainWindow):
     def _start_inline_ai_stream(self, prompt: str, insert_pos: int) -> None:
         if not prompt.strip():
             return
-        if getattr(self, "_inline_ai_worker", None):
+        if self._inline_ai_worker is not None:
             return
         try:
-            from .ai_chat_panel import ServerManager, ApiWorker
+            from .ai_chat_panel import ApiWorker
         except Exception:
             self.statusBar().showMessage("AI worker unavailable.", 4000)
             return
 
-        server_config: dict = {}
-        try:
-            default_server_name = config.load_default_ai_server()
-        except Exception:
-            default_server_name = None
-        try:
-            server_mgr = ServerManager()
-            if default_server_name:
-                server_cfg = server_mgr.get_server(default_server_name)
-                if server_cfg:
-                    server_config = server_cfg
-        except Exception:
-            server_config = {}
-        if not server_config:
-            self.statusBar().showMessage("No AI server configured.", 4000)
-            return
-
-        try:
-            default_model_name = config.load_default_ai_model()
-        except Exception:
-            default_model_name = None
-        model = default_model_name or server_config.get("default_model") or "gpt-3.5-turbo"
-
         system_prompt = _load_one_shot_prompt()
         messages = [
             {"role": "system", "content": system_prompt},
@@ -1030,12 +1387,14 @@ class PageEditorWindow(QMainWindow):
         cursor.setKeepPositionOnInsert(False)
         self._inline_ai_stream_cursor = cursor
         self._inline_ai_stream_used = False
+        self.editor.set_selection_updates_enabled(False)
         try:
             QApplication.setOverrideCursor(Qt.WaitCursor)
         except Exception:
             pass
 
-        worker = ApiWorker(server_config, messages, model, stream=True, parent=self)
+        # The default server/model are read from the global config inside the worker thread.
+        worker = ApiWorker(None, messages, None, stream=True, parent=self)
         worker.chunk.connect(self._append_inline_ai_chunk)
         worker.finished.connect(self._finalize_inline_ai_stream)
         worker.failed.connect(self._inline_ai_failed)
@@ -1046,19 +1405,34 @@ class PageEditorWindow(QMainWindow):
     def _append_inline_ai_chunk(self, chunk: str) -> None:
         if not chunk:
             return
-        cursor = getattr(self, "_inline_ai_stream_cursor", None)
+        if self._inline_ai_stream_cursor is None:
+            return
+        self._inline_ai_buffer.append(chunk)
+        self._inline_ai_stream_used = True
+        if not self._inline_ai_flush_timer.isActive():
+            self._inline_ai_flush_timer.start()
+
+    def _flush_inline_ai_buffer(self) -> None:
+        """Insert buffered stream chunks in one edit; stop ticking once the buffer is drained."""
+        if not self._inline_ai_buffer:
+            self._inline_ai_flush_timer.stop()
+            return
+        text = "".join(self._inline_ai_buffer)
+        self._inline_ai_buffer.clear()
+        cursor = self._inline_ai_stream_cursor
         if cursor is None:
             return
         try:
-            cursor.insertText(chunk)
-            self._inline_ai_stream_used = True
+            cursor.insertText(text)
         except Exception:
             pass
 
     def _finalize_inline_ai_stream(self, full: str) -> None:
         try:
-            cursor = getattr(self, "_inline_ai_stream_cursor", None)
-            used = getattr(self, "_inline_ai_stream_used", False)
+            self._inline_ai_flush_timer.stop()
+            self._flush_inline_ai_buffer()
+            cursor = self._inline_ai_stream_cursor
+            used = self._inline_ai_stream_used
             if cursor is not None and not used and full:
                 cursor.insertText(full)
             if cursor is not None:
@@ -1079,16 +1453,16 @@ class PageEditorWindow(QMainWindow):
             except Exception:
                 pass
             self._inline_ai_worker = None
-            for attr in ("_inline_ai_stream_cursor", "_inline_ai_stream_used"):
-                try:
-                    delattr(self, attr)
-                except Exception:
-                    pass
+            self._inline_ai_stream_cursor = None
+            self._inline_ai_stream_used = False
+            self.editor.set_selection_updates_enabled(True)
 
     def _inline_ai_failed(self, err: str) -> None:
         self.statusBar().showMessage(f"Inline AI failed: {err}", 6000)
+        self._inline_ai_flush_timer.stop()
+        self._flush_inline_ai_buffer()
         try:
-            cursor = getattr(self, "_inline_ai_stream_cursor", None)
+            cursor = self._inline_ai_stream_cursor
             if cursor is not None:
                 cursor.endEditBlock()
         except Exception:
@@ -1098,11 +1472,9 @@ class PageEditorWindow(QMainWindow):
         except Exception:
             pass
         self._inline_ai_worker = None
-        for attr in ("_inline_ai_stream_cursor", "_inline_ai_stream_used"):
-            try:
-                delattr(self, attr)
-            except Exception:
-                pass
+        self._inline_ai_stream_cursor = None
+        self._inline_ai_stream_used = False
+        self.editor.set_selection_updates_enabled(True)
 
     def eventFilter(self, obj, event):  # type: ignore[override]
         """Handle Ctrl key release to activate heading popup selection."""
@@ -1110,17 +1482,23 @@ class PageEditorWindow(QMainWindow):
             if event.key() == Qt.Key_Tab and (event.modifiers() & Qt.ControlModifier):
                 if event.modifiers() & Qt.ShiftModifier:
                     reverse = event.key() == Qt.Key_Backtab
-                    self._cycle_popup("heading", reverse=reverse)
+                    if event.isAutoRepeat():
+                        self._queue_heading_cycle(reverse)
+                    else:
+                        self._cycle_popup("heading", reverse=reverse)
                     return True
         elif event.type() == QEvent.KeyRelease:
             if event.key() == Qt.Key_Control and self._popup_items:
+                self._apply_pending_cycle()
                 self._activate_heading_popup_selection()
                 return True
         return super().eventFilter(obj, event)
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
         # Autosave on close if dirty and writable
+        self._finish_background_save()
         self._save_current_file(auto=False, reason="window close")
+        self._geometry_timer.stop()
         self._save_geometry()
         try:
             self.http.close()
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import os
 from typing import Callable, Optional
 
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QKeyEvent, QColor, QImage
+from PySide6.QtCore import Qt, Signal, Slot, QThread, QTimer
+from PySide6.QtGui import QGuiApplication, QKeyEvent, QImage, QImageReader, QPainter
 from PySide6.QtWidgets import (
+    QApplication,
     QComboBox,
     QDialog,
     QFrame,
@@ -14,15 +16,72 @@ from PySide6.QtWidgets import (
     QLabel,
     QTextEdit,
     QVBoxLayout,
-    QGraphicsDropShadowEffect,
 )
 
+from .card_shadow import paint_card_shadow
+
+_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"})
+# event.key() is a plain int; comparing against Qt enum members per keystroke is comparatively slow.
+_CAPTURE_KEYS = frozenset({Qt.Key_Return.value, Qt.Key_Enter.value})
+_ESCAPE_KEY = Qt.Key_Escape.value
+
+# One stylesheet for the whole overlay so it is parsed once rather than per widget.
+_QSS = (
+    "QFrame#QuickCaptureCard {"
+    "  background: #000000;"
+    "  border: 1px solid #222222;"
+    "  border-radius: 10px;"
+    "}"
+    "QTextEdit#QuickCaptureInput {"
+    "  font-size: 18px; color: white; background: rgba(255, 255, 255, 0.08);"
+    "  border: 1px solid rgba(255, 255, 255, 0.5); padding: 8px; border-radius: 6px;"
+    "}"
+    "QLabel#QuickCaptureHint { color: #dfe6fa; font-size: 12px; }"
+    "QLabel#QuickCaptureDetail { color: #dfe6fa; font-size: 11px; }"
+    "QLabel#QuickCaptureMuted { color: #9aa4b2; font-size: 11px; }"
+)
+
+
+def _probe_image(path: Path) -> Optional[tuple[Optional[int], Optional[int]]]:
+    """Return (width, height) for a readable image file, or None if it isn't one."""
+    if not path.exists():
+        return None
+    # Only the header is parsed; file attachments are copied byte-for-byte on capture.
+    reader = QImageReader(str(path))
+    reader.setDecideFormatFromContent(True)
+    if not reader.canRead():
+        return None
+    size = reader.size()
+    if not size.isValid():
+        return (None, None)
+    return (size.width(), size.height())
+
+
+def _attachment_line(idx: int, entry: dict) -> str:
+    name = entry.get("name") or f"clipboard image {idx}"
+    width = entry.get("width")
+    height = entry.get("height")
+    return f"{name} — {width}x{height}" if width and height else name
+
+
+class _ImageProbeWorker(QThread):
+    """Probe a batch of dropped image files off the GUI thread and keep the results."""
+
+    def __init__(self, paths: list[Path], parent=None) -> None:
+        super().__init__(parent)
+        self.paths = paths
+        self.results: list[tuple[Path, Optional[tuple[Optional[int], Optional[int]]]]] = []
+
+    def run(self) -> None:
+        self.results = [(path, _probe_image(path)) for path in self.paths]
+
 
 class QuickCaptureInput(QTextEdit):
     captureRequested = Signal()
     dismissRequested = Signal()
     imageAdded = Signal(object)
     imageFileAdded = Signal(object)
+    focusLost = Signal()
 
     def __init__(self, parent: Optional[QDialog] = None) -> None:
         super().__init__(parent)
@@ -32,19 +91,24 @@ class QuickCaptureInput(QTextEdit):
         self.setAcceptDrops(True)
 
     def keyPressEvent(self, event: QKeyEvent) -> None:  # type: ignore[override]
-        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+        key = event.key()
+        if key in _CAPTURE_KEYS:
             if event.modifiers() & Qt.ShiftModifier:
                 super().keyPressEvent(event)
                 return
             event.accept()
             self.captureRequested.emit()
             return
-        if event.key() == Qt.Key_Escape:
+        if key == _ESCAPE_KEY:
             event.accept()
             self.dismissRequested.emit()
             return
         super().keyPressEvent(event)
 
+    def focusOutEvent(self, event) -> None:  # type: ignore[override]
+        super().focusOutEvent(event)
+        self.focusLost.emit()
+
     def insertFromMimeData(self, source) -> None:  # type: ignore[override]
         if source and source.hasImage():
             image = source.imageData()
@@ -52,28 +116,38 @@ class QuickCaptureInput(QTextEdit):
                 self.imageAdded.emit(image)
                 return
         if source and source.hasUrls():
-            handled = False
-            for url in source.urls():
-                if url.isLocalFile():
-                    path = Path(url.toLocalFile())
-                    if path.suffix.lower() in {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}:
-                        self.imageFileAdded.emit(path)
-                        handled = True
-            if handled:
+            if self._emit_image_files(source.urls()):
                 return
         super().insertFromMimeData(source)
 
-    def dragEnterEvent(self, event) -> None:  # type: ignore[override]
-        if event.mimeData().hasImage() or event.mimeData().hasUrls():
+    def _emit_image_files(self, urls) -> bool:
+        handled = False
+        for url in urls:
+            if not url.isLocalFile():
+                continue
+            local = url.toLocalFile()
+            # Check the suffix on the raw string; only image files get a Path object.
+            if os.path.splitext(local)[1].lower() in _IMAGE_SUFFIXES:
+                self.imageFileAdded.emit(Path(local))
+                handled = True
+        return handled
+
+    @staticmethod
+    def _accept_if_droppable(event) -> bool:
+        mime = event.mimeData()
+        if mime.hasImage() or mime.hasUrls():
             event.acceptProposedAction()
-            return
-        super().dragEnterEvent(event)
+            return True
+        return False
+
+    def dragEnterEvent(self, event) -> None:  # type: ignore[override]
+        if not self._accept_if_droppable(event):
+            super().dragEnterEvent(event)
 
     def dragMoveEvent(self, event) -> None:  # type: ignore[override]
-        if event.mimeData().hasImage() or event.mimeData().hasUrls():
-            event.acceptProposedAction()
-            return
-        super().dragMoveEvent(event)
+        # Fires continuously while dragging over the input, so keep it to one mimeData() lookup.
+        if not self._accept_if_droppable(event):
+            super().dragMoveEvent(event)
 
     def dropEvent(self, event) -> None:  # type: ignore[override]
         if event.mimeData().hasImage():
@@ -83,14 +157,7 @@ class QuickCaptureInput(QTextEdit):
                 event.acceptProposedAction()
                 return
         if event.mimeData().hasUrls():
-            handled = False
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    path = Path(url.toLocalFile())
-                    if path.suffix.lower() in {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}:
-                        self.imageFileAdded.emit(path)
-                        handled = True
-            if handled:
+            if self._emit_image_files(event.mimeData().urls()):
                 event.acceptProposedAction()
                 return
         super().dropEvent(event)
@@ -115,37 +182,25 @@ class QuickCaptureOverlay(QDialog):
         self._vault_options = vault_options or []
         self._selected_vault = selected_vault
         self._attachments: list[dict] = []
-        self._focus_timer = QTimer(self)
-        self._focus_timer.setInterval(150)
-        self._focus_timer.timeout.connect(self._ensure_input_focus)
+        # Placeholder attachment entries for dropped files that still need probing.
+        self._pending_images: list[dict] = []
+        self._probe_worker: Optional[_ImageProbeWorker] = None
+        self._probe_entries: list[dict] = []
+        self._refresh_pending = False
+        self._last_attach_text = ""
         self._build_ui()
+        # No eager resize(sizeHint()): a never-resized window is fitted to its layout on first show.
         self.setMinimumWidth(700)
-        try:
-            self.resize(700, self.sizeHint().height())
-        except Exception:
-            pass
 
     def _build_ui(self) -> None:
+        self.setStyleSheet(_QSS)
         outer = QVBoxLayout(self)
         outer.setContentsMargins(10, 10, 10, 10)
 
         card = QFrame(self)
         card.setObjectName("QuickCaptureCard")
-        card.setStyleSheet(
-            "QFrame#QuickCaptureCard {"
-            "  background: #000000;"
-            "  border: 1px solid #222222;"
-            "  border-radius: 10px;"
-            "}"
-        )
-        try:
-            shadow = QGraphicsDropShadowEffect(card)
-            shadow.setBlurRadius(24)
-            shadow.setOffset(0, 6)
-            shadow.setColor(QColor(0, 0, 0, 90))
-            card.setGraphicsEffect(shadow)
-        except Exception:
-            pass
+        # The drop shadow is painted by the dialog from a cached tile (see paintEvent).
+        self._card = card
         outer.addWidget(card, 1)
         card.setMinimumWidth(680)
 
@@ -156,84 +211,119 @@ class QuickCaptureOverlay(QDialog):
         self.input = QuickCaptureInput(card)
         self.input.setMinimumHeight(90)
         self.input.setFocusPolicy(Qt.StrongFocus)
-        self.input.setStyleSheet(
-            "font-size: 18px; color: white; background: rgba(255, 255, 255, 0.08);"
-            "border: 1px solid rgba(255, 255, 255, 0.5); padding: 8px; border-radius: 6px;"
-        )
+        self.input.setObjectName("QuickCaptureInput")
         self.input.captureRequested.connect(self._capture)
         self.input.dismissRequested.connect(self.reject)
         self.input.imageAdded.connect(self._add_clipboard_image)
         self.input.imageFileAdded.connect(self._add_image_file)
+        self.input.focusLost.connect(lambda: QTimer.singleShot(0, self._ensure_input_focus))
         layout.addWidget(self.input)
 
         hint = QLabel("Enter to capture, Esc to dismiss", card)
-        hint.setStyleSheet("color: #dfe6fa; font-size: 12px;")
+        hint.setObjectName("QuickCaptureHint")
         layout.addWidget(hint)
 
         self.attachments_label = QLabel("", card)
-        self.attachments_label.setStyleSheet("color: #dfe6fa; font-size: 11px;")
+        self.attachments_label.setObjectName("QuickCaptureDetail")
         self.attachments_label.setWordWrap(True)
         layout.addWidget(self.attachments_label)
 
         if self._subtitle:
             sub = QLabel(self._subtitle, card)
-            sub.setStyleSheet("color: #9aa4b2; font-size: 11px;")
+            sub.setObjectName("QuickCaptureMuted")
             sub.setWordWrap(True)
             layout.addWidget(sub)
 
         if self._vault_options:
             vault_row = QHBoxLayout()
             vault_label = QLabel("Dropping to:", card)
-            vault_label.setStyleSheet("color: #9aa4b2; font-size: 11px;")
+            vault_label.setObjectName("QuickCaptureMuted")
             vault_row.addWidget(vault_label)
-            self.vault_combo = QComboBox(card)
-            for entry in self._vault_options:
-                self.vault_combo.addItem(entry.get("name") or entry.get("path") or "", entry.get("path"))
-            if self._selected_vault:
-                idx = self.vault_combo.findData(self._selected_vault)
-                if idx >= 0:
-                    self.vault_combo.setCurrentIndex(idx)
-            self.vault_combo.currentIndexChanged.connect(self._on_vault_changed)
-            vault_row.addWidget(self.vault_combo, 1)
+            if len(self._vault_options) == 1:
+                # Nothing to choose between; a plain label avoids building a combo and its popup view.
+                only = self._vault_options[0]
+                vault_name = QLabel(only.get("name") or only.get("path") or "", card)
+                vault_name.setObjectName("QuickCaptureDetail")
+                vault_row.addWidget(vault_name, 1)
+            else:
+                self.vault_combo = QComboBox(card)
+                # The first addItem and the initial selection would each emit index changes nobody needs.
+                self.vault_combo.blockSignals(True)
+                self.vault_combo.setUpdatesEnabled(False)
+                try:
+                    for entry in self._vault_options:
+                        self.vault_combo.addItem(entry.get("name") or entry.get("path") or "", entry.get("path"))
+                    if self._selected_vault:
+                        idx = self.vault_combo.findData(self._selected_vault)
+                        if idx >= 0:
+                            self.vault_combo.setCurrentIndex(idx)
+                finally:
+                    self.vault_combo.setUpdatesEnabled(True)
+                    self.vault_combo.blockSignals(False)
+                self.vault_combo.currentIndexChanged.connect(self._on_vault_changed)
+                vault_row.addWidget(self.vault_combo, 1)
             layout.addLayout(vault_row)
 
+    @Slot()
     def _capture(self) -> None:
+        self._finish_image_probe()
         text = (self.input.toPlainText() or "").strip()
-        if text:
-            try:
+        try:
+            if text:
+                # Let callback errors surface (Qt reports them from the slot) instead of hiding them.
                 self._on_capture(text, self._attachments, self._selected_vault)
-            except Exception:
-                pass
-        self.accept()
+        finally:
+            self.accept()
+
+    def done(self, result: int) -> None:  # type: ignore[override]
+        # Never let the dialog go away with a probe thread still running.
+        self._finish_image_probe()
+        super().done(result)
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
         self._ensure_input_focus()
-        self._focus_timer.start()
+        # Retry after the window manager has finished mapping/activating the popup.
+        QTimer.singleShot(0, self._ensure_input_focus)
+        QTimer.singleShot(50, self._ensure_input_focus)
         self._sync_attachment_width()
 
-    def hideEvent(self, event) -> None:  # type: ignore[override]
-        self._focus_timer.stop()
-        super().hideEvent(event)
-
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         super().resizeEvent(event)
         self._sync_attachment_width()
 
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        super().paintEvent(event)
+        painter = QPainter(self)
+        paint_card_shadow(painter, self._card.geometry())
+        painter.end()
+
+    @Slot()
     def _ensure_input_focus(self) -> None:
         if not self.isVisible():
             return
         if self.input.hasFocus():
             return
+        focused = QApplication.focusWidget()
+        if focused is not None and self.isAncestorOf(focused):
+            # Focus moved to another control in the overlay (e.g. the vault combo); leave it there.
+            return
+        handle = self.windowHandle()
+        if handle is not None and handle is QGuiApplication.focusWindow():
+            # Already the active window; raising/activating again only generates WM traffic.
+            self.input.setFocus()
+            return
         self.raise_()
         self.activateWindow()
         self.input.setFocus()
 
-    def _on_vault_changed(self) -> None:
+    @Slot(int)
+    def _on_vault_changed(self, _index: int = -1) -> None:
         if not hasattr(self, "vault_combo"):
             return
         self._selected_vault = self.vault_combo.currentData()
 
+    @Slot(object)
     def _add_clipboard_image(self, image: QImage) -> None:
         if image.isNull():
             return
@@ -244,43 +334,79 @@ class QuickCaptureOverlay(QDialog):
             "height": image.height(),
         }
         self._attachments.append(entry)
-        self._refresh_attachments()
+        self._schedule_refresh()
 
+    @Slot(object)
     def _add_image_file(self, path: Path) -> None:
-        if not path.exists():
+        # Reserve the slot now so attachments keep drop/paste order while the probe runs.
+        entry = {"kind": "pending", "path": path, "name": path.name}
+        self._attachments.append(entry)
+        self._schedule_refresh()
+        # Files from one drop arrive back to back; probe them as a single batch in the background.
+        self._pending_images.append(entry)
+        QTimer.singleShot(0, self._start_image_probe)
+
+    def _start_image_probe(self) -> None:
+        if self._probe_worker is not None or not self._pending_images:
             return
-        image = QImage(str(path))
-        if image.isNull():
+        self._probe_entries, self._pending_images = self._pending_images, []
+        worker = _ImageProbeWorker([entry["path"] for entry in self._probe_entries], self)
+        worker.finished.connect(lambda w=worker: self._on_image_probe_finished(w))
+        self._probe_worker = worker
+        worker.start()
+
+    def _on_image_probe_finished(self, worker: _ImageProbeWorker) -> None:
+        if worker is not self._probe_worker:
+            # Already applied synchronously by _finish_image_probe().
             return
-        entry = {
-            "kind": "file",
-            "path": path,
-            "name": path.name,
-            "width": image.width(),
-            "height": image.height(),
-        }
-        self._attachments.append(entry)
-        self._refresh_attachments()
+        self._apply_image_probe(self._probe_entries, worker.results)
+        worker.deleteLater()
+        self._start_image_probe()
+
+    def _finish_image_probe(self) -> None:
+        """Block until queued image files are probed so capture sees every attachment."""
+        worker = self._probe_worker
+        if worker is not None:
+            worker.wait()
+            self._apply_image_probe(self._probe_entries, worker.results)
+            worker.deleteLater()
+        if self._pending_images:
+            entries, self._pending_images = self._pending_images, []
+            self._apply_image_probe(entries, [(entry["path"], _probe_image(entry["path"])) for entry in entries])
+
+    def _apply_image_probe(self, entries: list[dict], results) -> None:
+        """Fill in the placeholders for probed files, dropping any that aren't readable images."""
+        self._probe_worker = None
+        self._probe_entries = []
+        unreadable: set[int] = set()
+        for entry, (_path, size) in zip(entries, results):
+            if size is None:
+                unreadable.add(id(entry))
+                continue
+            entry.update(kind="file", width=size[0], height=size[1])
+        if unreadable:
+            self._attachments = [e for e in self._attachments if id(e) not in unreadable]
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        # Several attachments can land in one event-loop turn; rebuild the label once.
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._refresh_attachments)
 
     def _refresh_attachments(self) -> None:
-        if not self._attachments:
-            self.attachments_label.setText("")
+        self._refresh_pending = False
+        text = ""
+        if self._attachments:
+            lines = [_attachment_line(idx, entry) for idx, entry in enumerate(self._attachments, start=1)]
+            text = "Attachments: " + "; ".join(lines)
+        if text == self._last_attach_text:
             return
-        lines = []
-        for idx, entry in enumerate(self._attachments, start=1):
-            name = entry.get("name") or f"clipboard image {idx}"
-            width = entry.get("width")
-            height = entry.get("height")
-            if width and height:
-                lines.append(f"{name} — {width}x{height}")
-            else:
-                lines.append(name)
-        self.attachments_label.setText("Attachments: " + "; ".join(lines))
-        self._sync_attachment_width()
+        self._last_attach_text = text
+        self.attachments_label.setText(text)
+        if text:
+            self._sync_attachment_width()
 
     def _sync_attachment_width(self) -> None:
-        try:
-            width = max(200, self.input.width())
-            self.attachments_label.setMaximumWidth(width)
-        except Exception:
-            pass
+        self.attachments_label.setMaximumWidth(max(200, self.input.width()))
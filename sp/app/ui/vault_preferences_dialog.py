@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -14,6 +14,21 @@ from PySide6.QtWidgets import (
 
 from sp.app import config
 
+# (section title, ((override key, checkbox label), ...)); keys match config.load_vault_overrides_bulk().
+_OVERRIDE_SECTIONS = (
+    (
+        "Features",
+        (
+            ("tasks", "Tasks"),
+            ("calendar", "Calendar"),
+            ("link_navigator", "Link Navigator"),
+            ("tags", "Page Tags"),
+            ("remote_vaults", "Remote Vaults"),
+        ),
+    ),
+    ("AI", (("ai_chats", "AI Chats"),)),
+)
+
 
 class VaultPreferencesDialog(QDialog):
     """Dialog for per-vault preference overrides."""
@@ -33,39 +48,14 @@ class VaultPreferencesDialog(QDialog):
         note.setStyleSheet("color: #666;")
         layout.addWidget(note)
 
-        layout.addWidget(QLabel("<b>Features</b>"))
-        self.feature_tasks_checkbox = self._make_override_checkbox(
-            "Tasks",
-            config.load_vault_feature_tasks_override(),
-        )
-        layout.addWidget(self.feature_tasks_checkbox)
-        self.feature_calendar_checkbox = self._make_override_checkbox(
-            "Calendar",
-            config.load_vault_feature_calendar_override(),
-        )
-        layout.addWidget(self.feature_calendar_checkbox)
-        self.feature_link_navigator_checkbox = self._make_override_checkbox(
-            "Link Navigator",
-            config.load_vault_feature_link_navigator_override(),
-        )
-        layout.addWidget(self.feature_link_navigator_checkbox)
-        self.feature_tags_checkbox = self._make_override_checkbox(
-            "Page Tags",
-            config.load_vault_feature_tags_override(),
-        )
-        layout.addWidget(self.feature_tags_checkbox)
-        self.feature_remote_vaults_checkbox = self._make_override_checkbox(
-            "Remote Vaults",
-            config.load_vault_feature_remote_vaults_override(),
-        )
-        layout.addWidget(self.feature_remote_vaults_checkbox)
-
-        layout.addWidget(QLabel("<b>AI</b>"))
-        self.ai_chats_checkbox = self._make_override_checkbox(
-            "AI Chats",
-            config.load_vault_enable_ai_chats_override(),
-        )
-        layout.addWidget(self.ai_chats_checkbox)
+        overrides = config.load_vault_overrides_bulk()
+        self._checkboxes: dict[str, QCheckBox] = {}
+        for section, rows in _OVERRIDE_SECTIONS:
+            layout.addWidget(QLabel(f"<b>{section}</b>"))
+            for key, label in rows:
+                checkbox = self._make_override_checkbox(label, overrides[key])
+                self._checkboxes[key] = checkbox
+                layout.addWidget(checkbox)
 
         layout.addStretch(1)
 
@@ -96,36 +86,18 @@ class VaultPreferencesDialog(QDialog):
         return state == Qt.Checked
 
     def _collect_values(self) -> dict[str, Optional[bool]]:
-        return {
-            "tasks": self._checkbox_value(self.feature_tasks_checkbox),
-            "calendar": self._checkbox_value(self.feature_calendar_checkbox),
-            "link_navigator": self._checkbox_value(self.feature_link_navigator_checkbox),
-            "tags": self._checkbox_value(self.feature_tags_checkbox),
-            "remote_vaults": self._checkbox_value(self.feature_remote_vaults_checkbox),
-            "ai_chats": self._checkbox_value(self.ai_chats_checkbox),
-        }
+        return {key: self._checkbox_value(checkbox) for key, checkbox in self._checkboxes.items()}
 
+    @Slot()
     def _reset_to_global(self) -> None:
-        for checkbox in (
-            self.feature_tasks_checkbox,
-            self.feature_calendar_checkbox,
-            self.feature_link_navigator_checkbox,
-            self.feature_tags_checkbox,
-            self.feature_remote_vaults_checkbox,
-            self.ai_chats_checkbox,
-        ):
+        for checkbox in self._checkboxes.values():
             checkbox.setCheckState(Qt.PartiallyChecked)
 
     def accept(self) -> None:  # type: ignore[override]
         values = self._collect_values()
-        changed = values != self._initial_values
-        config.save_vault_feature_tasks_override(values["tasks"])
-        config.save_vault_feature_calendar_override(values["calendar"])
-        config.save_vault_feature_link_navigator_override(values["link_navigator"])
-        config.save_vault_feature_tags_override(values["tags"])
-        config.save_vault_feature_remote_vaults_override(values["remote_vaults"])
-        config.save_vault_enable_ai_chats_override(values["ai_chats"])
+        changed = {key: value for key, value in values.items() if value != self._initial_values.get(key)}
         if changed:
+            config.save_vault_overrides_bulk(changed)
             QMessageBox.information(
                 self,
                 "Reopen Vault Required",
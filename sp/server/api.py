@@ -1146,6 +1146,19 @@ def file_read(payload: FilePathPayload) -> dict:
     return {"content": content, "rev": rev, "mtime_ns": mtime_ns}
 
 
+@app.get("/api/file/text")
+def file_text(path: str) -> Response:
+    """Return page text as UTF-8 markdown, skipping the JSON envelope of /api/file/read."""
+    root = vault_state.get_root()
+    try:
+        content = files.read_file(root, path)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except FileAccessError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return Response(content=content.encode("utf-8"), media_type="text/markdown; charset=utf-8")
+
+
 @app.get("/api/file/raw")
 def file_raw(path: str) -> FileResponse:
     root = _get_vault_root()
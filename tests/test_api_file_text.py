@@ -0,0 +1,48 @@
+import pytest
+
+api = pytest.importorskip("sp.server.api")
+from fastapi.testclient import TestClient
+
+from sp.server.state import vault_state
+
+
+@pytest.fixture
+def client(tmp_path):
+    previous = vault_state._state.root
+    vault_state.set_root(str(tmp_path))
+    try:
+        # No context manager: the lifespan admin-password check isn't relevant here.
+        yield TestClient(api.app)
+    finally:
+        vault_state._state.root = previous
+
+
+def test_file_text_returns_page_body_as_markdown(client, tmp_path):
+    page_dir = tmp_path / "Area"
+    page_dir.mkdir()
+    body = "# Area\n\nCafé ☕ — naïve\n"
+    (page_dir / "Area.md").write_text(body, encoding="utf-8")
+
+    resp = client.get("/api/file/text", params={"path": "/Area/Area.md"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "text/markdown; charset=utf-8"
+    assert resp.content == body.encode("utf-8")
+    read = client.post("/api/file/read", json={"path": "/Area/Area.md"})
+    assert read.json()["content"] == resp.text
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/Missing/Missing.md", 404),
+        ("/../outside.md", 400),
+        ("", 400),
+    ],
+)
+def test_file_text_error_mapping_matches_file_read(client, path, expected):
+    text = client.get("/api/file/text", params={"path": path})
+    read = client.post("/api/file/read", json={"path": path})
+
+    assert text.status_code == expected
+    assert read.status_code == expected
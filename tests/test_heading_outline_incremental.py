@@ -0,0 +1,102 @@
+import random
+
+import pytest
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QApplication
+
+from sp.app.ui.markdown_editor import MarkdownEditor
+
+
+_LINES = ("# Title {n}", "## Section {n}", "### Deep {n}", "body text {n}", "- item {n}", "---", "")
+_SNIPPETS = ("# new\n", "## sub\n", "x", "\n", "#", " ", "---\n", "text\n\n")
+
+
+def _ensure_qapp() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return _ensure_qapp()
+
+
+def _random_markdown(rng: random.Random, count: int) -> str:
+    return "\n".join(rng.choice(_LINES).format(n=i) for i in range(count)) + "\n"
+
+
+def _incremental_outline(editor: MarkdownEditor) -> list[dict]:
+    editor._emit_heading_outline()
+    return [dict(entry) for entry in editor._heading_outline]
+
+
+def _full_outline(editor: MarkdownEditor) -> list[dict]:
+    """Rescan from the top without disturbing the incremental state the next edit builds on."""
+    kept = editor._heading_outline
+    editor._outline_dirty_pos = 0
+    editor._emit_heading_outline()
+    full = [dict(entry) for entry in editor._heading_outline]
+    editor._heading_outline = kept
+    editor._outline_dirty_pos = None
+    return full
+
+
+def _heading_block_position(editor: MarkdownEditor, rng: random.Random) -> int:
+    headings = [h for h in editor._heading_outline if h.get("type") != "hr"]
+    doc = editor.document()
+    if not headings:
+        return rng.randint(0, doc.characterCount() - 1)
+    block = doc.findBlock(rng.choice(headings)["position"])
+    # Edit just above, inside or just below the chosen heading line.
+    target = rng.choice((block.previous(), block, block.next()))
+    if not target.isValid():
+        target = block
+    return target.position() + rng.randint(0, max(0, target.length() - 1))
+
+
+def _random_edit(editor: MarkdownEditor, rng: random.Random) -> None:
+    doc = editor.document()
+    last = doc.characterCount() - 1
+    op = rng.random()
+    if op < 0.05:
+        editor.setPlainText(_random_markdown(rng, rng.randint(0, 40)))
+        return
+    if op < 0.08:
+        editor.unload_for_delete()
+        return
+    cursor = QTextCursor(doc)
+    position = _heading_block_position(editor, rng) if op < 0.6 else rng.randint(0, last)
+    cursor.setPosition(min(position, last))
+    if rng.random() < 0.55:
+        cursor.insertText(rng.choice(_SNIPPETS))
+    else:
+        cursor.setPosition(min(last, cursor.position() + rng.randint(1, 20)), QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_incremental_outline_matches_full_rescan(app: QApplication, seed: int) -> None:
+    rng = random.Random(seed)
+    editor = MarkdownEditor()
+    editor.setPlainText(_random_markdown(rng, 120))
+    assert _incremental_outline(editor) == _full_outline(editor)
+    for step in range(150):
+        _random_edit(editor, rng)
+        # Sometimes let several edits pile up before the outline is refreshed.
+        if rng.random() < 0.6:
+            assert _incremental_outline(editor) == _full_outline(editor), f"seed={seed} step={step}"
+    assert _incremental_outline(editor) == _full_outline(editor)
+
+
+def test_outline_after_unload_then_reload(app: QApplication) -> None:
+    editor = MarkdownEditor()
+    editor.setPlainText("# One\n\ntext\n\n## Two\n")
+    assert [h["title"] for h in _incremental_outline(editor)] == ["One", "Two"]
+    editor.unload_for_delete()
+    assert _incremental_outline(editor) == []
+    editor.setPlainText("intro\n# Three\n")
+    outline = _incremental_outline(editor)
+    assert outline == _full_outline(editor)
+    assert [(h["title"], h["line"]) for h in outline] == [("Three", 2)]
@@ -0,0 +1,136 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from sp.app.ui.page_editor_window import PageEditorWindow, _HeadingListModel
+
+
+_TITLES = (
+    "Introduction",
+    "Straße und Brücke",
+    "Strasse notes",
+    "STRASSE",
+    "Meeting notes",
+    "Notes on notes",
+    "ß",
+    "Ärger",
+    "Tasks",
+    "Task list (draft)",
+    "abc",
+    "ab",
+)
+
+
+def _ensure_qapp() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture(scope="module")
+def app() -> QApplication:
+    return _ensure_qapp()
+
+
+def _toc(titles) -> list[dict]:
+    """Build picker rows the same way the window derives them from the editor outline."""
+    owner = SimpleNamespace(_toc_derived={})
+    headings = [{"title": title, "level": 1 + i % 3, "line": i + 1} for i, title in enumerate(titles)]
+    PageEditorWindow._on_headings_changed(owner, headings)
+    return owner._toc_headings
+
+
+def _titles(model: _HeadingListModel) -> list[str]:
+    return [model.heading(row)["title"] for row in range(model.rowCount())]
+
+
+def _expected(titles, query: str) -> list[str]:
+    needle = query.casefold().strip()
+    return [t for t in titles if needle in t.casefold()]
+
+
+def _count_resets(model: _HeadingListModel) -> list[int]:
+    resets = [0]
+    model.modelReset.connect(lambda: resets.__setitem__(0, resets[0] + 1))
+    return resets
+
+
+def test_extend_then_backspace_restores_all_rows(app: QApplication) -> None:
+    model = _HeadingListModel()
+    model.set_headings(_toc(_TITLES))
+    query = "notes"
+    for end in range(1, len(query) + 1):
+        model.set_filter(query[:end])
+        assert _titles(model) == _expected(_TITLES, query[:end])
+    for end in range(len(query) - 1, -1, -1):
+        model.set_filter(query[:end])
+        assert _titles(model) == _expected(_TITLES, query[:end])
+    assert _titles(model) == list(_TITLES)
+
+
+def test_unchanged_query_does_not_reset(app: QApplication) -> None:
+    model = _HeadingListModel()
+    toc = _toc(_TITLES)
+    model.set_headings(toc)
+    model.set_filter("task")
+    resets = _count_resets(model)
+
+    model.set_filter("task")
+    model.set_filter("  TASK ")
+
+    assert resets[0] == 0
+    assert _titles(model) == ["Tasks", "Task list (draft)"]
+
+
+def test_same_headings_unfiltered_does_not_reset(app: QApplication) -> None:
+    model = _HeadingListModel()
+    toc = _toc(_TITLES)
+    model.set_headings(toc)
+    resets = _count_resets(model)
+
+    model.set_headings(toc)
+    model.set_filter("")
+
+    assert resets[0] == 0
+    assert model.rowCount() == len(_TITLES)
+
+
+def test_narrowing_that_drops_nothing_keeps_rows(app: QApplication) -> None:
+    model = _HeadingListModel()
+    model.set_headings(_toc(_TITLES))
+    assert model.set_filter("meet") is True
+    resets = _count_resets(model)
+
+    assert model.set_filter("meeting") is False
+
+    assert resets[0] == 0
+    assert _titles(model) == ["Meeting notes"]
+    assert model.set_filter("meetings") is True
+
+
+@pytest.mark.parametrize("query", ["", "s", "ß", "ss", "SS", "st", "straße", "STRASSE", "aße", "ärg", "ab", "abc", " no", "(d", "zzz"])
+def test_filter_matches_casefold_substring(app: QApplication, query: str) -> None:
+    model = _HeadingListModel()
+    model.set_headings(_toc(_TITLES))
+    model.set_filter(query)
+    assert _titles(model) == _expected(_TITLES, query)
+
+
+def test_trigram_prefilter_agrees_with_substring_under_random_typing(app: QApplication) -> None:
+    rng = random.Random(0)
+    alphabet = "abenorstß ÄäSN("
+    model = _HeadingListModel()
+    model.set_headings(_toc(_TITLES))
+    query = ""
+    for _ in range(500):
+        if query and rng.random() < 0.35:
+            query = query[:-1]
+        elif rng.random() < 0.05:
+            query = ""
+        else:
+            query += rng.choice(alphabet)
+        model.set_filter(query)
+        assert _titles(model) == _expected(_TITLES, query), repr(query)
@@ -0,0 +1,66 @@
+"""Tests for the per-vault feature override round trip."""
+
+import pytest
+
+from sp.app import config
+
+
+@pytest.fixture
+def test_db(tmp_path):
+    config.set_active_vault(str(tmp_path))
+    yield
+    config.set_active_vault(None)
+
+
+_PER_KEY_LOADERS = {
+    "tasks": config.load_vault_feature_tasks_override,
+    "calendar": config.load_vault_feature_calendar_override,
+    "link_navigator": config.load_vault_feature_link_navigator_override,
+    "tags": config.load_vault_feature_tags_override,
+    "remote_vaults": config.load_vault_feature_remote_vaults_override,
+    "ai_chats": config.load_vault_enable_ai_chats_override,
+}
+
+
+def test_per_key_loaders_cover_every_override():
+    assert set(_PER_KEY_LOADERS) == set(config._VAULT_OVERRIDE_KEYS)
+
+
+def test_bulk_save_is_seen_by_per_key_loaders(test_db):
+    values = {
+        "tasks": True,
+        "calendar": False,
+        "link_navigator": True,
+        "tags": False,
+        "remote_vaults": True,
+        "ai_chats": False,
+    }
+    config.save_vault_overrides_bulk(values)
+
+    for name, loader in _PER_KEY_LOADERS.items():
+        assert loader() is values[name], name
+    assert config.load_vault_overrides_bulk() == values
+
+
+def test_bulk_save_none_clears_override(test_db):
+    config.save_vault_overrides_bulk({name: True for name in _PER_KEY_LOADERS})
+
+    config.save_vault_overrides_bulk({"calendar": None, "ai_chats": None})
+
+    assert config.load_vault_feature_calendar_override() is None
+    assert config.load_vault_enable_ai_chats_override() is None
+    assert config.load_vault_feature_tasks_override() is True
+    bulk = config.load_vault_overrides_bulk()
+    assert bulk["calendar"] is None and bulk["ai_chats"] is None
+    assert bulk["tags"] is True
+
+
+def test_per_key_save_is_seen_by_bulk_loader(test_db):
+    config.save_vault_feature_tags_override(False)
+    config.save_vault_enable_ai_chats_override(True)
+
+    bulk = config.load_vault_overrides_bulk()
+
+    assert bulk["tags"] is False
+    assert bulk["ai_chats"] is True
+    assert bulk["tasks"] is None